@@ -689,7 +689,7 @@ Target Audience: {st.session_state.target_audience}
 Kill Reason: {kill_reason}
 
 Available data:
-{json.dumps(all_results, indent=2)}
+{json.dumps(all_results)}
 
 Provide a summary with:
 1. Viability score (1-10)
@@ -703,7 +703,7 @@ Format as JSON with keys: viability_score, strengths, risks, next_steps, recomme
         else:
             prompt = VALIDATION_SUMMARY_PROMPT.format(
                 idea_description=st.session_state.problem_description,
-                all_results_json=json.dumps(all_results, indent=2)
+                all_results_json=json.dumps(all_results)
             )
         
         response = claude_client.generate_response(
@@ -893,48 +893,37 @@ Format as JSON with keys: viability_score, strengths, risks, next_steps, recomme
     exporter = ReportExporter()
     all_results["summary"] = summary
     
-    # Generate PDF
+    # Write all three formats concurrently
+    with st.spinner("Generating reports..."):
+        export_paths = exporter.export_all(all_results)
+    
+    # PDF
     with col1:
-        with st.spinner("Generating PDF..."):
-            pdf_path = exporter.export_to_pdf(all_results)
-            with open(pdf_path, "rb") as pdf_file:
-                pdf_bytes = pdf_file.read()
-        
         st.download_button(
             label="📥 Download PDF Report",
-            data=pdf_bytes,
+            data=export_paths["pdf"].read_bytes(),
             file_name=f"kill_switch_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
             mime="application/pdf",
             use_container_width=True,
             help="Download a comprehensive PDF report of your validation results"
         )
     
-    # Generate CSV
+    # CSV
     with col2:
-        with st.spinner("Generating CSV..."):
-            csv_path = exporter.export_to_csv(all_results)
-            with open(csv_path, "r") as csv_file:
-                csv_data = csv_file.read()
-        
         st.download_button(
             label="📥 Download CSV Data",
-            data=csv_data,
+            data=export_paths["csv"].read_text(),
             file_name=f"kill_switch_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv",
             use_container_width=True,
             help="Download data in CSV format for further analysis"
         )
     
-    # Generate JSON
+    # JSON
     with col3:
-        with st.spinner("Generating JSON..."):
-            json_path = exporter.export_to_json(all_results)
-            with open(json_path, "r") as json_file:
-                json_data = json_file.read()
-        
         st.download_button(
             label="📥 Download JSON Data",
-            data=json_data,
+            data=export_paths["json"].read_text(),
             file_name=f"kill_switch_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             mime="application/json",
             use_container_width=True,
@@ -14,6 +14,12 @@ FIRECRAWL_API_KEY = os.getenv("FIRECRAWL_API_KEY")
 # Claude Settings
 CLAUDE_MODEL = "claude-sonnet-4-20250514"  # Claude Sonnet 4 - High-performance with exceptional reasoning
 # Pricing: $3/1M input tokens, $15/1M output tokens
+CLAUDE_PRICING = {  # (input, output) USD per token
+    "claude-sonnet-4-20250514": (3e-6, 15e-6),
+    "claude-opus-4-20250514": (15e-6, 75e-6),
+    "claude-3-5-sonnet-20241022": (3e-6, 15e-6),
+    "claude-3-5-haiku-20241022": (0.8e-6, 4e-6),
+}
 CLAUDE_MAX_TOKENS = 4096
 CLAUDE_TEMPERATURE = 0.7
 
@@ -22,6 +28,8 @@ SERPER_BASE_URL = "https://google.serper.dev"
 # Pricing: $0.30 per 1000 queries = $0.0003 per query
 SERPER_SEARCH_LIMIT = 500  # Increased to handle broader searches
 SERPER_TIME_RANGE = "6 months"
+SERPER_MAX_CONCURRENCY = int(os.getenv("SERPER_MAX_CONCURRENCY", "8"))  # Parallel search requests
+SERPER_BATCH_SIZE = 20  # Queries per bulk /search request
 
 # Firecrawl Settings
 FIRECRAWL_BASE_URL = "https://api.firecrawl.dev/v1"
@@ -30,6 +38,11 @@ FIRECRAWL_BATCH_SIZE = int(os.getenv("FIRECRAWL_BATCH_SIZE", "10"))  # URLs per
 FIRECRAWL_MAX_URLS = int(os.getenv("FIRECRAWL_MAX_URLS", "30"))  # Max URLs to scrape per module (general)
 FIRECRAWL_PAIN_RESEARCH_MAX_URLS = int(os.getenv("FIRECRAWL_PAIN_RESEARCH_MAX_URLS", "75"))  # Higher limit for pain research
 FIRECRAWL_MARKET_ANALYSIS_MAX_URLS = int(os.getenv("FIRECRAWL_MARKET_ANALYSIS_MAX_URLS", "50"))  # Increased for detailed competitor analysis
+FIRECRAWL_MAX_CONCURRENCY = int(os.getenv("FIRECRAWL_MAX_CONCURRENCY", "8"))  # Parallel scrape requests
+FIRECRAWL_REQUESTS_PER_SECOND = float(os.getenv("FIRECRAWL_REQUESTS_PER_SECOND", "2"))  # Global request pacing
+FIRECRAWL_BATCH_POLL_INTERVAL = 2  # seconds between batch job status checks
+FIRECRAWL_BATCH_TIMEOUT = 120  # seconds to wait for a batch job before falling back
+FIRECRAWL_MAX_RESPONSE_BYTES = int(os.getenv("FIRECRAWL_MAX_RESPONSE_BYTES", str(512 * 1024)))  # Per scraped page
 FIRECRAWL_TIMEOUT = 30000  # ms
 FIRECRAWL_WAIT_FOR = 3000  # ms
 
@@ -76,6 +89,13 @@ REQUEST_TIMEOUT = 30  # seconds
 # Cache Settings
 ENABLE_CACHE = True
 CACHE_TTL = 3600  # 1 hour
+CACHE_MAX_SIZE = 2048  # Max cached Claude responses per client
+SERPER_CACHE_TTL = 300  # 5 minutes; search results go stale quickly
+SERPER_CACHE_MAX_SIZE = 512  # Max cached Serper responses per process
+QUERY_CACHE_TTL = 86400  # 1 day; AI-generated search query lists
+ENABLE_DISK_CACHE = os.getenv("ENABLE_DISK_CACHE", "true").lower() == "true"  # Persist responses across restarts
+CACHE_DIR = Path(os.getenv("CACHE_DIR", Path.home() / ".idea_kill_switch"))
+DISK_CACHE_SIZE_LIMIT = int(2e9)  # 2 GB
 
 # UI Settings
 PROGRESS_UPDATE_INTERVAL = 0.5  # seconds
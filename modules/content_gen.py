@@ -256,10 +256,10 @@ class ContentGenerationModule:
             Pain Points: {json.dumps(pain_points)}
             
             Landing Page:
-            {json.dumps(landing_page, indent=2)}
+            {json.dumps(landing_page)}
             
             Social Posts Sample:
-            {json.dumps({k: v[:1] for k, v in social_posts.items()}, indent=2)}
+            {json.dumps({k: v[:1] for k, v in social_posts.items()})}
             
             Provide:
             1. Predicted signup conversion rate (0.0 to 1.0)
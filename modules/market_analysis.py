@@ -604,8 +604,8 @@ class MarketAnalysisModule:
             # Generate prompt
             prompt = MARKET_ANALYSIS_PROMPT.format(
                 problem_description=problem,
-                competitors_json=json.dumps(competitors_for_analysis, indent=2),
-                market_data_json=json.dumps(market_data, indent=2)
+                competitors_json=json.dumps(competitors_for_analysis),
+                market_data_json=json.dumps(market_data)
             )
             
             # Get analysis from Claude
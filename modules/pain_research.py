@@ -183,7 +183,8 @@ class PainResearchModule:
                         complaints = self.firecrawl_client.get_scraped_content_for_analysis(
                             complaints, 
                             progress_callback,
-                            module_type="pain_research"
+                            module_type="pain_research",
+                            inplace=True  # Fresh dicts from clean_search_results
                         )
                         
                         # Track Firecrawl API cost (estimate based on successful scrapes)
@@ -273,7 +274,7 @@ class PainResearchModule:
             # Generate prompt
             prompt = PAIN_ANALYSIS_PROMPT.format(
                 problem_description=problem,
-                complaints_json=json.dumps(complaints_for_analysis, indent=2)
+                complaints_json=json.dumps(complaints_for_analysis)
             )
             
             # Get analysis from Claude
@@ -137,7 +137,7 @@ class SurveyAnalysisModule:
             # Analyze with Claude
             prompt = SURVEY_ANALYSIS_PROMPT.format(
                 solution_description=solution_description,
-                responses_json=json.dumps(responses, indent=2)
+                responses_json=json.dumps(responses)
             )
             
             response = self.claude_client.generate_response(
@@ -0,0 +1,390 @@
+"""Tests for API client and export utilities."""
+import csv
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+from unittest.mock import Mock, patch
+
+from utils.claude_client import ClaudeClient, _loads_lenient
+from utils.exporters import ReportExporter
+from utils.firecrawl_client import FirecrawlClient
+from utils.serper_client import SerperClient
+
+
+def _make_claude_client(create):
+    """Build a ClaudeClient with caching disabled and a mocked messages.create."""
+    anthropic = Mock()
+    anthropic.messages.create = create
+    with patch('utils.claude_client.ANTHROPIC_API_KEY', 'test-key'), \
+         patch('utils.claude_client.ENABLE_CACHE', False), \
+         patch('utils.claude_client.get_anthropic_client', return_value=anthropic):
+        return ClaudeClient()
+
+
+def _claude_response(text):
+    """Build a minimal messages.create response."""
+    response = Mock()
+    response.content = [Mock(text=text)]
+    response.usage = Mock(input_tokens=10, output_tokens=5)
+    response.model = "test-model"
+    response.stop_reason = "end_turn"
+    return response
+
+
+class TestClaudeClient:
+    """Test Claude client request handling."""
+
+    def _run_concurrently(self, client, count=5):
+        """Call generate_response from several threads with the same prompt."""
+        barrier = threading.Barrier(count)
+        results, errors = [], []
+
+        def call():
+            barrier.wait()
+            try:
+                results.append(client.generate_response("same prompt"))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads, results, errors
+
+    def test_concurrent_identical_requests_share_one_call(self):
+        """Test identical in-flight requests are coalesced into one API call."""
+        release = threading.Event()
+
+        def create(**kwargs):
+            release.wait(5)
+            return _claude_response("shared answer")
+
+        create_mock = Mock(side_effect=create)
+        client = _make_claude_client(create_mock)
+
+        threads, results, errors = self._run_concurrently(client)
+        time.sleep(0.2)  # Let every thread reach the in-flight check
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert create_mock.call_count == 1
+        assert not errors
+        assert len(results) == 5
+        assert all(result["content"] == "shared answer" for result in results)
+        assert client._inflight == {}
+
+    def test_concurrent_identical_requests_share_failure(self):
+        """Test waiters receive the error raised by the in-flight call."""
+        release = threading.Event()
+
+        def create(**kwargs):
+            release.wait(5)
+            raise RuntimeError("boom")
+
+        create_mock = Mock(side_effect=create)
+        client = _make_claude_client(create_mock)
+
+        threads, results, errors = self._run_concurrently(client)
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert create_mock.call_count == 1
+        assert not results
+        assert len(errors) == 5
+        assert all(str(error) == "boom" for error in errors)
+        assert client._inflight == {}
+
+
+class TestLoadsLenient:
+    """Test lenient JSON parsing of model responses."""
+
+    def test_plain_json(self):
+        """Test valid JSON is parsed unchanged."""
+        assert _loads_lenient('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_code_fence(self):
+        """Test markdown code fences are stripped."""
+        assert _loads_lenient('```json\n["x", "y"]\n```') == ["x", "y"]
+
+    def test_surrounding_prose(self):
+        """Test the JSON value is extracted from surrounding prose."""
+        content = 'Here are the results:\n{"score": 7}\nHope this helps.'
+        assert _loads_lenient(content) == {"score": 7}
+
+    def test_trailing_commas(self):
+        """Test trailing commas in objects and arrays are removed."""
+        assert _loads_lenient('{"a": [1, 2,], "b": 3,}') == {"a": [1, 2], "b": 3}
+
+    def test_unrepairable_content(self):
+        """Test content without valid JSON raises ValueError."""
+        with pytest.raises(ValueError):
+            _loads_lenient("no json here")
+
+
+@pytest.fixture
+def serper_client():
+    """Build a SerperClient without a disk cache."""
+    with patch('utils.serper_client.SERPER_API_KEY', 'test-key'), \
+         patch('utils.serper_client.ENABLE_DISK_CACHE', False):
+        return SerperClient()
+
+
+def _search_batch(count):
+    """Build (payload, future) pairs for _run_search_batch."""
+    return [({"q": f"query {i}"}, Future()) for i in range(count)]
+
+
+class TestSerperClient:
+    """Test Serper client batching and result parsing."""
+
+    def test_bulk_search_resolves_each_future(self, serper_client):
+        """Test one bulk POST resolves every query in order."""
+        batch = _search_batch(3)
+        serper_client._post = Mock(return_value=[{"n": 0}, {"n": 1}, {"n": 2}])
+
+        with patch('utils.serper_client.ENABLE_CACHE', False):
+            serper_client._run_search_batch(batch)
+
+        serper_client._post.assert_called_once_with("search", [p for p, _ in batch])
+        assert [f.result(0) for _, f in batch] == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+    def test_bulk_search_failure_resolves_every_future(self, serper_client):
+        """Test a failed bulk POST sets the error on every future."""
+        batch = _search_batch(3)
+        serper_client._post = Mock(side_effect=RuntimeError("down"))
+
+        with patch('utils.serper_client.ENABLE_CACHE', False):
+            serper_client._run_search_batch(batch)
+
+        for _, future in batch:
+            assert future.done()
+            assert isinstance(future.exception(0), RuntimeError)
+
+    def test_bulk_search_unsupported_falls_back_per_query(self, serper_client):
+        """Test a non-list bulk response falls back to one POST per query."""
+        batch = _search_batch(3)
+
+        def post(endpoint, payload):
+            if isinstance(payload, list):
+                return {"organic": []}
+            if payload["q"] == "query 1":
+                raise RuntimeError("bad query")
+            return {"q": payload["q"]}
+
+        serper_client._post = Mock(side_effect=post)
+
+        with patch('utils.serper_client.ENABLE_CACHE', False):
+            serper_client._run_search_batch(batch)
+
+        assert serper_client._post.call_count == 4
+        assert serper_client._batch_supported is False
+        assert batch[0][1].result(0) == {"q": "query 0"}
+        assert isinstance(batch[1][1].exception(0), RuntimeError)
+        assert batch[2][1].result(0) == {"q": "query 2"}
+
+    def test_cache_failure_still_resolves_futures(self, serper_client):
+        """Test an error while caching results does not leave futures pending."""
+        batch = _search_batch(2)
+        serper_client._post = Mock(return_value=[{"n": 0}, {"n": 1}])
+        serper_client._store_cached = Mock(side_effect=OSError("disk full"))
+
+        with patch('utils.serper_client.ENABLE_CACHE', True):
+            serper_client._run_search_batch(batch)
+
+        assert [f.result(0) for _, f in batch] == [{"n": 0}, {"n": 1}]
+
+
+    def test_extract_rating_takes_leftmost_match(self, serper_client):
+        """Test the first rating in the snippet wins regardless of its format."""
+        result = {"snippet": "Users give it 4 stars overall, 4.5/5 on G2"}
+        assert serper_client._extract_rating(result) == 4.0
+
+    def test_extract_rating_formats(self, serper_client):
+        """Test each supported rating format and non-ratings."""
+        assert serper_client._extract_rating({"snippet": "Rated 4.7 out of 5"}) == 4.7
+        assert serper_client._extract_rating({"snippet": "Scored 3/5 by users"}) == 3.0
+        assert serper_client._extract_rating({"snippet": "1 star, avoid"}) == 1.0
+        assert serper_client._extract_rating({"snippet": "Won 12/50 matches"}) is None
+        assert serper_client._extract_rating({}) is None
+
+    def test_identify_source_takes_leftmost_platform(self):
+        """Test the platform matched first in the URL wins, not the first listed."""
+        assert SerperClient._identify_source("https://medium.com/p/why-reddit.com-threads") == "Medium"
+        assert SerperClient._identify_source("https://www.reddit.com/r/saas/comments/1") == "Reddit"
+        assert SerperClient._identify_source("https://www.amazon.com/review/R1ABC") == "Amazon Reviews"
+
+    def test_identify_source_generic_fallbacks(self):
+        """Test unknown hosts fall back to generic categories, then Web."""
+        assert SerperClient._identify_source("https://example.com/support/forum") == "Forum"
+        assert SerperClient._identify_source("https://community.example.com/t/1") == "Community"
+        assert SerperClient._identify_source("https://example.com/blog/post") == "Web"
+
+@pytest.fixture
+def firecrawl_client():
+    """Build a FirecrawlClient whose batch jobs time out immediately."""
+    with patch('utils.firecrawl_client.FIRECRAWL_API_KEY', 'test-key'), \
+         patch('utils.firecrawl_client.FIRECRAWL_BATCH_TIMEOUT', 0), \
+         patch('utils.firecrawl_client.FIRECRAWL_BATCH_POLL_INTERVAL', 0):
+        client = FirecrawlClient()
+        client.scrape_single_url = Mock(side_effect=lambda url: {
+            "url": url, "success": True, "content": "single", "title": "", "error": None
+        })
+        yield client
+
+
+_BATCH_URLS = [
+    "https://www.reddit.com/r/smallbusiness/comments/abc123/inventory_pain/",
+    "https://www.reddit.com/r/smallbusiness/comments/def456/stock_tracking/"
+]
+
+
+class TestFirecrawlClient:
+    """Test Firecrawl batch scraping fallbacks."""
+
+    def test_batch_timeout_cancels_job_and_scrapes_missing_urls(self, firecrawl_client):
+        """Test a timed-out job is cancelled and unfinished URLs are scraped singly."""
+        finished = {"markdown": "batch content", "metadata": {"sourceURL": _BATCH_URLS[0]}}
+        firecrawl_client._send_request = Mock(return_value={"id": "job1"})
+        firecrawl_client._make_request = Mock(return_value={"status": "scraping", "data": [finished]})
+
+        results = firecrawl_client.batch_scrape_urls(_BATCH_URLS)
+
+        firecrawl_client._send_request.assert_any_call("batch/scrape/job1", method="DELETE")
+        firecrawl_client.scrape_single_url.assert_called_once_with(_BATCH_URLS[1])
+        by_url = {r["url"]: r for r in results}
+        assert by_url[_BATCH_URLS[0]]["content"] == "batch content"
+        assert by_url[_BATCH_URLS[1]]["content"] == "single"
+        assert all("retry" not in r for r in results)
+
+    def test_failed_batch_job_falls_back_to_single_scrapes(self, firecrawl_client):
+        """Test a failed job is not cancelled and every URL is scraped singly."""
+        firecrawl_client._send_request = Mock(return_value={"id": "job1"})
+        firecrawl_client._make_request = Mock(return_value={"status": "failed"})
+
+        results = firecrawl_client.batch_scrape_urls(_BATCH_URLS)
+
+        firecrawl_client._send_request.assert_called_once()
+        assert firecrawl_client.scrape_single_url.call_count == 2
+        assert all(r["success"] and r["content"] == "single" for r in results)
+
+    def test_batch_job_create_is_not_retried(self, firecrawl_client):
+        """Test a failed job creation is sent once, then URLs are scraped singly."""
+        firecrawl_client._send_request = Mock(side_effect=RuntimeError("timeout"))
+        firecrawl_client._make_request = Mock()
+
+        results = firecrawl_client.batch_scrape_urls(_BATCH_URLS)
+
+        firecrawl_client._send_request.assert_called_once()
+        firecrawl_client._make_request.assert_not_called()
+        assert firecrawl_client.scrape_single_url.call_count == 2
+        assert len(results) == 2
+
+
+_EXPORT_RESULTS = {
+    "summary": {"viability_score": 72, "recommendation": "GO"},
+    "pain_research": {
+        "pain_score": 8.5,
+        "is_urgent_problem": True,
+        "complaints_analyzed": 40,
+        "analysis_summary": "Frequent, costly complaints"
+    },
+    "market_analysis": {
+        "avg_pricing": {"monthly_average": 49, "monthly_low": 19, "monthly_high": 99},
+        "opportunity_score": 6,
+        "insights": "Crowded at the low end"
+    },
+    "survey_analysis": {"avg_wtp": 35.5, "percent_over_50": 20}
+}
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    """Build a ReportExporter that writes into a temporary directory."""
+    with patch('utils.exporters.EXPORT_DIR', tmp_path):
+        return ReportExporter()
+
+
+class TestReportExporter:
+    """Test CSV, JSON and Parquet export round-trips."""
+
+    def test_csv_round_trip(self, exporter):
+        """Test CSV export writes one row per metric."""
+        filepath = exporter.export_to_csv(_EXPORT_RESULTS, "data.csv")
+
+        with open(filepath, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == ["Section", "Metric", "Value", "Details"]
+        assert rows[1] == ["Summary", "Overall Score", "72", "GO"]
+        assert ["Pain Research", "Is Urgent Problem", "Yes", "Frequent, costly complaints"] in rows
+        assert ["Market Analysis", "Average Pricing", "$49", "Range: $19-$99"] in rows
+        assert len(rows) == 7
+
+    def test_json_round_trip(self, exporter):
+        """Test pretty JSON export matches a plain json.dumps layout."""
+        filepath = exporter.export_to_json(_EXPORT_RESULTS, "results.json")
+
+        text = filepath.read_text(encoding='utf-8')
+        data = json.loads(text)
+        assert data["results"] == _EXPORT_RESULTS
+        assert data["metadata"]["version"] == "1.0"
+        assert text == json.dumps(data, indent=2)
+
+    def test_json_gzip_round_trip(self, exporter):
+        """Test compact JSON export is gzipped with a .gz suffix."""
+        filepath = exporter.export_to_json(_EXPORT_RESULTS, "results.json", pretty=False)
+
+        assert filepath.name == "results.json.gz"
+        with gzip.open(filepath, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        assert data["results"] == _EXPORT_RESULTS
+
+    def test_json_empty_results(self, exporter):
+        """Test JSON export of empty results is still valid JSON."""
+        for pretty in (True, False):
+            filepath = exporter.export_to_json({}, f"empty_{pretty}.json", pretty=pretty)
+            opener = open if pretty else gzip.open
+            with opener(filepath, 'rt', encoding='utf-8') as f:
+                assert json.load(f)["results"] == {}
+
+    def test_parquet_round_trip(self, exporter):
+        """Test Parquet export keeps the CSV rows with a float32 value column."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        filepath = exporter.export_to_parquet(_EXPORT_RESULTS, "data.parquet")
+        table = pq.read_table(filepath)
+
+        assert table.column_names == ["section", "metric", "value", "value_text", "details"]
+        assert table.schema.field("value").type == pa.float32()
+        rows = table.to_pylist()
+        assert len(rows) == 6
+        by_metric = {row["metric"]: row for row in rows}
+        assert by_metric["Overall Score"]["value"] == 72.0
+        assert by_metric["Is Urgent Problem"]["value"] == 1.0
+        assert by_metric["Is Urgent Problem"]["value_text"] == "Yes"
+        assert by_metric["Average WTP"]["value"] == pytest.approx(35.5)
+        assert by_metric["Average WTP"]["value_text"] == "$35.5"
+
+    def test_parquet_non_numeric_value_is_null(self, exporter):
+        """Test metrics without a numeric value are stored as null."""
+        pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        filepath = exporter.export_to_parquet({"summary": {}}, "summary.parquet")
+        rows = pq.read_table(filepath).to_pylist()
+
+        assert rows == [{
+            "section": "Summary",
+            "metric": "Overall Score",
+            "value": None,
+            "value_text": "N/A",
+            "details": ""
+        }]
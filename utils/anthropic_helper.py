@@ -1,9 +1,15 @@
 """Helper to initialize Anthropic client without proxy issues."""
 import os
 import sys
+import threading
 
-def get_anthropic_client(api_key: str):
-    """Get Anthropic client instance, handling proxy issues."""
+# Connection pool shared by every Anthropic client in the process, so
+# recreated ClaudeClient instances reuse warm TLS connections
+_shared_http_client = None
+_shared_http_client_lock = threading.Lock()
+
+def _without_proxy_env(factory):
+    """Run a client factory with proxy variables temporarily removed."""
     # Store original environment
     original_env = {}
     proxy_vars = ['HTTP_PROXY', 'HTTPS_PROXY', 'http_proxy', 'https_proxy', 
@@ -16,15 +22,38 @@ def get_anthropic_client(api_key: str):
             del os.environ[var]
     
     try:
-        # Import Anthropic in clean environment
-        from anthropic import Anthropic
-        
-        # Create client
-        client = Anthropic(api_key=api_key)
-        
-        return client
+        return factory()
         
     finally:
         # Restore original environment
         for var, value in original_env.items():
-            os.environ[var] = value
\ No newline at end of file
+            os.environ[var] = value
+
+def _get_shared_http_client():
+    """Get the process-wide httpx client, creating it on first use."""
+    global _shared_http_client
+    with _shared_http_client_lock:
+        if _shared_http_client is None:
+            def factory():
+                import httpx
+                from anthropic import DefaultHttpxClient
+                
+                return DefaultHttpxClient(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+                )
+            
+            _shared_http_client = _without_proxy_env(factory)
+        return _shared_http_client
+
+def get_anthropic_client(api_key: str):
+    """Get Anthropic client instance, handling proxy issues."""
+    http_client = _get_shared_http_client()
+    
+    def factory():
+        # Import Anthropic in clean environment
+        from anthropic import Anthropic
+        
+        # Create client
+        return Anthropic(api_key=api_key, http_client=http_client)
+    
+    return _without_proxy_env(factory)
\ No newline at end of file
@@ -1,26 +1,252 @@
 """Claude API client wrapper with retry logic and caching."""
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Any, Union
 from functools import lru_cache
 import hashlib
 import json
 import re
-from anthropic import APIError
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
+from anthropic import APIConnectionError, InternalServerError, RateLimitError
+from cachetools import TTLCache
+from diskcache import Cache
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+try:
+    import streamlit as st
+    _HAS_STREAMLIT = True
+except ImportError:  # Used outside the Streamlit app
+    _HAS_STREAMLIT = False
 
 from utils.anthropic_helper import get_anthropic_client
 from config.settings import (
     ANTHROPIC_API_KEY,
     CLAUDE_MODEL,
+    CLAUDE_PRICING,
     CLAUDE_MAX_TOKENS,
     CLAUDE_TEMPERATURE,
     MAX_RETRIES,
     RETRY_DELAY,
     REQUEST_TIMEOUT,
     ENABLE_CACHE,
-    CACHE_TTL
+    CACHE_TTL,
+    CACHE_MAX_SIZE,
+    ENABLE_DISK_CACHE,
+    CACHE_DIR,
+    DISK_CACHE_SIZE_LIMIT,
+    QUERY_CACHE_TTL
 )
 
+# Transient API failures worth retrying; other errors (bad requests, auth)
+# propagate to the caller on the first attempt
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+# Patterns for unwrapping JSON from Claude responses
+_FENCE_OPEN = re.compile(r'^```(?:json)?\s*')
+_FENCE_CLOSE = re.compile(r'\s*```$')
+_JSON_ARRAY = re.compile(r'\[[\s\S]*\]')
+# A line holding one quoted query, optionally list-marked and comma-terminated;
+# the closing quote may be missing when the model truncates a line
+_QUOTED_LINE = re.compile(r'''^\s*(?:[-*•]|\d+[.)])?\s*(["'])(.*?)\1?\s*,?\s*$''', re.MULTILINE)
+_ESCAPED_CHAR = re.compile(r'''\\(["'\\])''')
+_JSON_VALUE = re.compile(r'[\[{][\s\S]*[\]}]')
+_TRAILING_COMMA = re.compile(r',\s*([\]}])')
+# Rough English text density, for responses cut off before their final usage
+_CHARS_PER_TOKEN = 4
+
+# User prompt given either as plain text or as Anthropic content blocks
+Prompt = Union[str, List[Dict[str, Any]]]
+
+# System prompts shared by the analyzers and generators
+_SYSTEM_ANALYST = "You are an expert business analyst evaluating market problems."
+_SYSTEM_MARKET_ANALYST = "You are a market research analyst evaluating business opportunities."
+_SYSTEM_COPYWRITER = "You are an expert copywriter creating high-converting landing pages."
+_SYSTEM_SOCIAL = "You are a social media expert creating authentic, engaging posts."
+_SYSTEM_SURVEY = "You are a user research expert creating validation surveys."
+_SYSTEM_PRICING = "You are a pricing analyst evaluating survey data."
+_SYSTEM_SEARCH_QUERIES = "You are an expert at search query optimization. Return only valid JSON arrays."
+_SYSTEM_COMPETITOR_QUERIES = "You are an expert at competitive intelligence and market research. Return only valid JSON arrays."
+
+# Static analysis instructions; the data being analyzed is sent as a separate
+# content block after these so the prompt text itself never changes
+_COMPLAINTS_INSTRUCTIONS = """Analyze the complaints in the next message block about the problem described there.
+
+Please provide:
+1. A pain score from 1-10 based on urgency and frustration level
+2. Key recurring themes
+3. Most impactful quotes (max 5)
+4. Assessment of whether this is a real, urgent problem
+
+Format your response as JSON with keys: pain_score, themes, key_quotes, is_urgent_problem"""
+
+_MARKET_INSTRUCTIONS = """Analyze the competitive landscape for the problem and competitors in the next message block.
+
+Please provide:
+1. Market size estimate
+2. Average pricing analysis
+3. Key gaps in current solutions
+4. Market opportunity assessment
+
+Format your response as JSON with keys: market_size, avg_pricing, gaps, opportunity_score"""
+
+_SURVEY_ANALYSIS_INSTRUCTIONS = """Analyze the survey responses about willingness to pay in the next message block.
+
+Calculate and provide:
+1. Average willingness to pay (monthly)
+2. Price range (min to max)
+3. Most requested features
+4. Key insights about pricing
+5. Recommendation on viable pricing
+
+Format as JSON with keys: avg_wtp, price_range, top_features, insights, recommended_price"""
+
+# Prompt templates, filled with str.format_map
+_TMPL_LANDING = """Create landing page copy for a solution to: {problem}
+
+Target audience: {target_audience}
+Key pain points to address: {pain_points_json}
+
+Generate:
+1. Compelling headline
+2. Subheadline
+3. 3 benefit bullet points
+4. Call-to-action text
+5. Email signup form copy
+
+Format as JSON with keys: headline, subheadline, benefits, cta_text, email_copy"""
+
+_TMPL_SOCIAL = """Create social media posts about a new solution for: {problem}
+Solution teaser: {solution_teaser}
+
+Generate 3 posts for each platform: {platforms}
+
+Requirements:
+- Sound like real people sharing frustration, not sales pitches
+- Include natural mention of signup link
+- Platform-appropriate length and tone
+
+Format as JSON with platform names as keys, each containing a list of posts"""
+
+_TMPL_SURVEY = """Create survey questions to validate willingness to pay for: {proposed_solution}
+Problem being solved: {problem}
+
+Generate 5-7 questions including:
+- Willingness to pay (with price ranges)
+- Current workarounds and their costs
+- Must-have features
+- Purchase decision factors
+
+Format as JSON array of question strings"""
+
+_TMPL_SEARCH_QUERIES = """You are an expert at crafting search queries to find user discussions and pain points online.
+
+Problem Description: {problem_description}
+{target_audience_line}
+
+CRITICAL: First, extract the CORE PROBLEM from the description. If they say "I want to make X", figure out what problem X solves.
+For example:
+- "I want to make a web app for marketers which gives ideal creatives" → marketers, creative design, ad creation, marketing visuals
+- "I want to build email automation" → email marketing, email campaigns, marketing automation
+
+Generate {num_queries} search queries to find discussions about this topic. 
+
+IMPORTANT RULES FOR MAXIMUM RESULTS:
+1. **Keep queries SHORT and SIMPLE** - 2-5 words maximum
+2. **Avoid too many operators** - Use site: sparingly, avoid complex OR statements
+3. **Don't use quotes** unless absolutely necessary - let search engines find variations
+4. **Cast a WIDE NET** - We'll filter for pain points later
+5. **Use natural language** - How people actually talk about these topics
+
+Distribute queries as follows:
+
+1. **Reddit** (20 queries):
+   - Simple: marketing creatives reddit
+   - With basic keywords: struggle with ad design reddit
+   - Natural questions: how to create marketing visuals reddit
+   - Avoid complex operators, just add "reddit" to queries
+
+2. **Forums and Q&A** (15 queries):
+   - marketing design help forum
+   - ad creative problems quora
+   - Simple, conversational queries
+
+3. **General Web** (25 queries):
+   - marketing creative challenges
+   - ad design frustrations
+   - creating marketing content difficult
+   - Simple phrases people might use
+
+Examples of GOOD queries (simple, broad):
+- marketing creatives difficult
+- ad design time consuming
+- social media graphics help
+- marketing visuals frustrated
+- creating ads problem
+
+Examples of BAD queries (too specific, too many operators):
+- site:reddit.com "marketing creatives" "pain in the ass" OR frustrating
+- "web app for marketers" AND "ideal creatives" -tutorial
+- intitle:"marketing design tools" review problems OR issues
+
+Return ONLY a JSON array of SIMPLE search query strings. Make them broad enough to get results, we'll analyze for pain points later."""
+
+_TMPL_COMPETITOR_QUERIES = """Based on this problem and the pain points discovered, generate search queries to find existing solutions and competitors.
+
+Problem: {problem}
+
+Pain Points:
+{pain_points_list}
+
+Generate 15 search queries that will help find:
+1. Existing software/tools that solve these pain points
+2. Companies providing solutions to these problems
+3. Alternatives people are using
+
+Think about:
+- What would someone search for when looking for a solution to these pain points?
+- What keywords would existing solutions use in their marketing?
+- What terms would appear on competitor websites?
+
+Return ONLY a JSON array of search query strings. Keep queries simple and focused.
+
+Examples of good queries:
+- "automated invoice processing software"
+- "customer feedback management platform"
+- "marketing automation tools pricing"
+
+Return the queries as a JSON array."""
+
+
+def _instructions_with_payload(instructions: str, payload: str) -> List[Dict[str, Any]]:
+    """Build user content blocks: static instructions, then the data payload."""
+    return [
+        {"type": "text", "text": instructions},
+        {"type": "text", "text": payload}
+    ]
+
+
+def _loads_lenient(content: str) -> Any:
+    """Parse JSON from a model response, repairing common formatting slips.
+    
+    Handles code fences, prose around the JSON value and trailing commas.
+    Raises ValueError if the content still cannot be parsed.
+    """
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        pass
+    
+    content = content.strip()
+    if content.startswith('```'):
+        content = _FENCE_OPEN.sub('', content)
+        content = _FENCE_CLOSE.sub('', content)
+    
+    match = _JSON_VALUE.search(content)
+    if match:
+        content = match.group()
+    return orjson.loads(_TRAILING_COMMA.sub(r'\1', content))
+
 
 class ClaudeClient:
     """Wrapper for Claude API with enhanced error handling and caching."""
@@ -34,94 +260,227 @@ class ClaudeClient:
         self.client = get_anthropic_client(ANTHROPIC_API_KEY)
         
         self.model = CLAUDE_MODEL
-        self._cache = {} if ENABLE_CACHE else None
-        self._cache_timestamps = {}
+        self._base_params = {"model": self.model}  # Parameters shared by every request
+        # Per-token rates, defaulting to Sonnet pricing for unlisted models
+        self._input_rate, self._output_rate = CLAUDE_PRICING.get(self.model, (3e-6, 15e-6))
+        # Bounded cache; entries expire CACHE_TTL seconds after insertion
+        self._cache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL) if ENABLE_CACHE else None
+        # Persistent cache shared across Streamlit restarts
+        self._disk_cache = (
+            Cache(str(CACHE_DIR / "claude_cache"), size_limit=DISK_CACHE_SIZE_LIMIT)
+            if ENABLE_CACHE and ENABLE_DISK_CACHE else None
+        )
+        # Requests currently being made, so identical concurrent calls share one
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
     
-    def _get_cache_key(self, prompt: str, **kwargs) -> str:
+    def _get_cache_key(self, prompt: Prompt, **kwargs) -> str:
         """Generate cache key from prompt and parameters."""
         cache_data = {
             "prompt": prompt,
             "model": self.model,
             **kwargs
         }
-        cache_str = json.dumps(cache_data, sort_keys=True)
-        return hashlib.md5(cache_str.encode()).hexdigest()
+        cache_bytes = orjson.dumps(cache_data, option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(cache_bytes, digest_size=16).hexdigest()
     
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cached response is still valid."""
-        if not ENABLE_CACHE or cache_key not in self._cache_timestamps:
-            return False
+    def _get_cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a response in the memory cache, then the disk cache."""
+        cached = self._cache.get(cache_key)
+        if cached is None and self._disk_cache is not None:
+            cached = self._disk_cache.get(cache_key)
+            if cached is not None:
+                self._cache[cache_key] = cached
+        return cached
+    
+    def _set_cached(self, cache_key: str, result: Dict[str, Any]):
+        """Store a response in the memory and disk caches."""
+        self._cache[cache_key] = result
+        if self._disk_cache is not None:
+            self._disk_cache.set(cache_key, result, expire=CACHE_TTL)
+    
+    def _build_request_params(
+        self,
+        prompt: Prompt,
+        system_prompt: Optional[str],
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build the messages.create parameters shared by every request path."""
+        request_params = {
+            **self._base_params,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens or CLAUDE_MAX_TOKENS,
+            "temperature": temperature or CLAUDE_TEMPERATURE
+        }
+        if kwargs:
+            request_params.update(kwargs)
+        
+        # Only add system if it's provided
+        if system_prompt:
+            request_params["system"] = system_prompt
+        
+        return request_params
+    
+    def _format_response(self, response) -> Dict[str, Any]:
+        """Convert an API response into the result dict returned to callers."""
+        usage = response.usage
+        input_tokens = usage.input_tokens
+        output_tokens = usage.output_tokens
+        
+        result = {
+            "content": response.content[0].text if response.content else "",
+            "usage": {
+                "prompt_tokens": input_tokens,
+                "completion_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens
+            },
+            "model": response.model,
+            "stop_reason": response.stop_reason
+        }
         
-        elapsed = time.time() - self._cache_timestamps[cache_key]
-        return elapsed < CACHE_TTL
+        result["cost"] = input_tokens * self._input_rate + output_tokens * self._output_rate
+        
+        return result
     
     @retry(
         stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(multiplier=RETRY_DELAY, min=2, max=30)
+        wait=wait_exponential(multiplier=RETRY_DELAY, min=2, max=30),
+        retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+        reraise=True
     )
     def generate_response(
         self,
-        prompt: str,
+        prompt: Prompt,
         system_prompt: Optional[str] = None,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Generate response from Claude API with retry logic."""
-        # Check cache first
-        if ENABLE_CACHE:
-            cache_key = self._get_cache_key(prompt, system_prompt=system_prompt, **kwargs)
-            if self._is_cache_valid(cache_key):
-                return self._cache[cache_key]
+        cache_key = self._get_cache_key(prompt, system_prompt=system_prompt, **kwargs)
         
-        # Prepare messages
-        messages = [{"role": "user", "content": prompt}]
+        # Check cache first
+        if self._cache is not None:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+        
+        # Wait on an identical request already in flight instead of repeating it
+        with self._inflight_lock:
+            inflight = self._inflight.get(cache_key)
+            if inflight is None:
+                future = self._inflight[cache_key] = Future()
+        if inflight is not None:
+            return inflight.result()
         
-        # Make API request
         try:
-            # Build request parameters
-            request_params = {
-                "model": self.model,
-                "messages": messages,
-                "max_tokens": max_tokens or CLAUDE_MAX_TOKENS,
-                "temperature": temperature or CLAUDE_TEMPERATURE,
-                **kwargs
-            }
-            
-            # Only add system if it's provided
-            if system_prompt:
-                request_params["system"] = system_prompt
+            # Make API request
+            request_params = self._build_request_params(
+                prompt, system_prompt, max_tokens, temperature, **kwargs
+            )
             
             response = self.client.messages.create(**request_params)
-            
-            result = {
-                "content": response.content[0].text if response.content else "",
-                "usage": {
-                    "prompt_tokens": response.usage.input_tokens,
-                    "completion_tokens": response.usage.output_tokens,
-                    "total_tokens": response.usage.input_tokens + response.usage.output_tokens
-                },
-                "model": response.model,
-                "stop_reason": response.stop_reason
-            }
-            
-            # Calculate cost (Claude Sonnet 4 pricing)
-            # Input: $3 per 1M tokens, Output: $15 per 1M tokens
-            input_cost = (response.usage.input_tokens / 1000000) * 3.0
-            output_cost = (response.usage.output_tokens / 1000000) * 15.0
-            result["cost"] = input_cost + output_cost
+            result = self._format_response(response)
             
             # Cache the result
-            if ENABLE_CACHE:
-                self._cache[cache_key] = result
-                self._cache_timestamps[cache_key] = time.time()
+            if self._cache is not None:
+                self._set_cached(cache_key, result)
             
+            future.set_result(result)
             return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+    
+    @retry(
+        stop=stop_after_attempt(MAX_RETRIES),
+        wait=wait_exponential(multiplier=RETRY_DELAY, min=2, max=30),
+        retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+        reraise=True
+    )
+    def generate_response_streamed(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Stream a response that should be a JSON array and return just the array.
+        
+        The text is scanned as it arrives, and the stream is closed as soon
+        as the top-level array is balanced instead of waiting for (and paying
+        for) trailing commentary. The API only reports output tokens when a message
+        finishes, so for a closed stream they are estimated from the text
+        received. Worth it for long list outputs; short prompts should keep
+        using generate_response.
+        
+        Responses are not cached here; the query generators that use this
+        cache their parsed query lists instead.
+        """
+        request_params = self._build_request_params(
+            prompt, system_prompt, max_tokens, temperature, **kwargs
+        )
+        
+        buffer = ""
+        start = end = None
+        depth = 0
+        in_string = False
+        escaped = False
+        at_line_start = True
+        with self.client.messages.stream(**request_params) as stream:
+            for text in stream.text_stream:
+                offset = len(buffer)
+                buffer += text
+                for index, char in enumerate(text, offset):
+                    if not depth:
+                        # Only a "[" opening a line starts the array, so
+                        # bracketed prose before it is skipped
+                        if char == "[" and at_line_start:
+                            start = index
+                            depth = 1
+                        elif char == "\n":
+                            at_line_start = True
+                        elif not char.isspace():
+                            at_line_start = False
+                    elif in_string:
+                        if escaped:
+                            escaped = False
+                        elif char == "\\":
+                            escaped = True
+                        elif char == '"':
+                            in_string = False
+                    elif char == '"':
+                        in_string = True
+                    elif char == "[":
+                        depth += 1
+                    elif char == "]":
+                        depth -= 1
+                        if not depth:
+                            end = index + 1
+                            break
+                if end is not None:
+                    break
             
-        except APIError as e:
-            raise Exception(f"Claude API error: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Unexpected error calling Claude API: {str(e)}")
+            # Leaving the context manager closes the connection, so nothing
+            # past the text received so far is generated
+            message = stream.current_message_snapshot
+            if end is not None:
+                message.usage.output_tokens = max(
+                    message.usage.output_tokens, -(-len(buffer) // _CHARS_PER_TOKEN)
+                )
+        
+        result = self._format_response(message)
+        if end is not None:
+            result["content"] = buffer[start:end]
+        
+        return result
     
     def analyze_complaints(
         self,
@@ -129,31 +488,17 @@ class ClaudeClient:
         problem_description: str
     ) -> Dict[str, Any]:
         """Analyze complaints for pain level and urgency."""
-        prompt = f"""
-        Analyze the following complaints about {problem_description}:
-        
-        {json.dumps(complaints, indent=2)}
-        
-        Please provide:
-        1. A pain score from 1-10 based on urgency and frustration level
-        2. Key recurring themes
-        3. Most impactful quotes (max 5)
-        4. Assessment of whether this is a real, urgent problem
-        
-        Format your response as JSON with keys: pain_score, themes, key_quotes, is_urgent_problem
-        """
-        
-        system_prompt = "You are an expert business analyst evaluating market problems."
+        payload = json.dumps({"problem": problem_description, "complaints": complaints})
         
         response = self.generate_response(
-            prompt=prompt,
-            system_prompt=system_prompt,
+            prompt=_instructions_with_payload(_COMPLAINTS_INSTRUCTIONS, payload),
+            system_prompt=_SYSTEM_ANALYST,
             temperature=0.3  # Lower temperature for more consistent analysis
         )
         
         try:
-            return json.loads(response["content"])
-        except json.JSONDecodeError:
+            return _loads_lenient(response["content"])
+        except ValueError:
             # Fallback parsing if JSON is malformed
             return {
                 "pain_score": 5,
@@ -168,32 +513,17 @@ class ClaudeClient:
         problem_description: str
     ) -> Dict[str, Any]:
         """Analyze market and competitor landscape."""
-        prompt = f"""
-        Analyze the competitive landscape for {problem_description}:
-        
-        Competitors found:
-        {json.dumps(competitors, indent=2)}
-        
-        Please provide:
-        1. Market size estimate
-        2. Average pricing analysis
-        3. Key gaps in current solutions
-        4. Market opportunity assessment
-        
-        Format your response as JSON with keys: market_size, avg_pricing, gaps, opportunity_score
-        """
-        
-        system_prompt = "You are a market research analyst evaluating business opportunities."
+        payload = json.dumps({"problem": problem_description, "competitors": competitors})
         
         response = self.generate_response(
-            prompt=prompt,
-            system_prompt=system_prompt,
+            prompt=_instructions_with_payload(_MARKET_INSTRUCTIONS, payload),
+            system_prompt=_SYSTEM_MARKET_ANALYST,
             temperature=0.3
         )
         
         try:
-            return json.loads(response["content"])
-        except json.JSONDecodeError:
+            return _loads_lenient(response["content"])
+        except ValueError:
             return {
                 "market_size": "Unknown",
                 "avg_pricing": 0,
@@ -208,33 +538,21 @@ class ClaudeClient:
         target_audience: str
     ) -> Dict[str, str]:
         """Generate landing page copy."""
-        prompt = f"""
-        Create landing page copy for a solution to: {problem}
-        
-        Target audience: {target_audience}
-        Key pain points to address: {json.dumps(pain_points)}
-        
-        Generate:
-        1. Compelling headline
-        2. Subheadline
-        3. 3 benefit bullet points
-        4. Call-to-action text
-        5. Email signup form copy
-        
-        Format as JSON with keys: headline, subheadline, benefits, cta_text, email_copy
-        """
-        
-        system_prompt = "You are an expert copywriter creating high-converting landing pages."
+        prompt = _TMPL_LANDING.format_map({
+            "problem": problem,
+            "target_audience": target_audience,
+            "pain_points_json": json.dumps(pain_points)
+        })
         
         response = self.generate_response(
             prompt=prompt,
-            system_prompt=system_prompt,
+            system_prompt=_SYSTEM_COPYWRITER,
             temperature=0.7
         )
         
         try:
-            return json.loads(response["content"])
-        except json.JSONDecodeError:
+            return _loads_lenient(response["content"])
+        except ValueError:
             return {
                 "headline": "Transform Your Business",
                 "subheadline": "The solution you've been waiting for",
@@ -250,31 +568,21 @@ class ClaudeClient:
         platforms: List[str]
     ) -> Dict[str, List[str]]:
         """Generate social media posts for different platforms."""
-        prompt = f"""
-        Create social media posts about a new solution for: {problem}
-        Solution teaser: {solution_teaser}
-        
-        Generate 3 posts for each platform: {', '.join(platforms)}
-        
-        Requirements:
-        - Sound like real people sharing frustration, not sales pitches
-        - Include natural mention of signup link
-        - Platform-appropriate length and tone
-        
-        Format as JSON with platform names as keys, each containing a list of posts
-        """
-        
-        system_prompt = "You are a social media expert creating authentic, engaging posts."
+        prompt = _TMPL_SOCIAL.format_map({
+            "problem": problem,
+            "solution_teaser": solution_teaser,
+            "platforms": ", ".join(platforms)
+        })
         
         response = self.generate_response(
             prompt=prompt,
-            system_prompt=system_prompt,
+            system_prompt=_SYSTEM_SOCIAL,
             temperature=0.8
         )
         
         try:
-            return json.loads(response["content"])
-        except json.JSONDecodeError:
+            return _loads_lenient(response["content"])
+        except ValueError:
             return {platform: ["Check out our solution!"] for platform in platforms}
     
     def generate_survey_questions(
@@ -283,30 +591,20 @@ class ClaudeClient:
         proposed_solution: str
     ) -> List[str]:
         """Generate survey questions for validation."""
-        prompt = f"""
-        Create survey questions to validate willingness to pay for: {proposed_solution}
-        Problem being solved: {problem}
-        
-        Generate 5-7 questions including:
-        - Willingness to pay (with price ranges)
-        - Current workarounds and their costs
-        - Must-have features
-        - Purchase decision factors
-        
-        Format as JSON array of question strings
-        """
-        
-        system_prompt = "You are a user research expert creating validation surveys."
+        prompt = _TMPL_SURVEY.format_map({
+            "problem": problem,
+            "proposed_solution": proposed_solution
+        })
         
         response = self.generate_response(
             prompt=prompt,
-            system_prompt=system_prompt,
+            system_prompt=_SYSTEM_SURVEY,
             temperature=0.5
         )
         
         try:
-            return json.loads(response["content"])
-        except json.JSONDecodeError:
+            return _loads_lenient(response["content"])
+        except ValueError:
             return [
                 "How much would you pay monthly for this solution?",
                 "What do you currently use to solve this problem?",
@@ -318,32 +616,17 @@ class ClaudeClient:
         responses: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Analyze survey responses for pricing insights."""
-        prompt = f"""
-        Analyze these survey responses about willingness to pay:
-        
-        {json.dumps(responses, indent=2)}
-        
-        Calculate and provide:
-        1. Average willingness to pay (monthly)
-        2. Price range (min to max)
-        3. Most requested features
-        4. Key insights about pricing
-        5. Recommendation on viable pricing
-        
-        Format as JSON with keys: avg_wtp, price_range, top_features, insights, recommended_price
-        """
-        
-        system_prompt = "You are a pricing analyst evaluating survey data."
+        payload = json.dumps({"responses": responses})
         
         response = self.generate_response(
-            prompt=prompt,
-            system_prompt=system_prompt,
+            prompt=_instructions_with_payload(_SURVEY_ANALYSIS_INSTRUCTIONS, payload),
+            system_prompt=_SYSTEM_PRICING,
             temperature=0.3
         )
         
         try:
-            return json.loads(response["content"])
-        except json.JSONDecodeError:
+            return _loads_lenient(response["content"])
+        except ValueError:
             return {
                 "avg_wtp": 0,
                 "price_range": {"min": 0, "max": 0},
@@ -359,72 +642,31 @@ class ClaudeClient:
         num_queries: int = 60
     ) -> List[str]:
         """Generate optimized search queries for finding complaints."""
-        prompt = f"""You are an expert at crafting search queries to find user discussions and pain points online.
-
-Problem Description: {problem_description}
-{f'Target Audience: {target_audience}' if target_audience else ''}
-
-CRITICAL: First, extract the CORE PROBLEM from the description. If they say "I want to make X", figure out what problem X solves.
-For example:
-- "I want to make a web app for marketers which gives ideal creatives" → marketers, creative design, ad creation, marketing visuals
-- "I want to build email automation" → email marketing, email campaigns, marketing automation
-
-Generate {num_queries} search queries to find discussions about this topic. 
-
-IMPORTANT RULES FOR MAXIMUM RESULTS:
-1. **Keep queries SHORT and SIMPLE** - 2-5 words maximum
-2. **Avoid too many operators** - Use site: sparingly, avoid complex OR statements
-3. **Don't use quotes** unless absolutely necessary - let search engines find variations
-4. **Cast a WIDE NET** - We'll filter for pain points later
-5. **Use natural language** - How people actually talk about these topics
-
-Distribute queries as follows:
-
-1. **Reddit** (20 queries):
-   - Simple: marketing creatives reddit
-   - With basic keywords: struggle with ad design reddit
-   - Natural questions: how to create marketing visuals reddit
-   - Avoid complex operators, just add "reddit" to queries
-
-2. **Forums and Q&A** (15 queries):
-   - marketing design help forum
-   - ad creative problems quora
-   - Simple, conversational queries
-
-3. **General Web** (25 queries):
-   - marketing creative challenges
-   - ad design frustrations
-   - creating marketing content difficult
-   - Simple phrases people might use
-
-Examples of GOOD queries (simple, broad):
-- marketing creatives difficult
-- ad design time consuming
-- social media graphics help
-- marketing visuals frustrated
-- creating ads problem
-
-Examples of BAD queries (too specific, too many operators):
-- site:reddit.com "marketing creatives" "pain in the ass" OR frustrating
-- "web app for marketers" AND "ideal creatives" -tutorial
-- intitle:"marketing design tools" review problems OR issues
-
-Return ONLY a JSON array of SIMPLE search query strings. Make them broad enough to get results, we'll analyze for pain points later."""
+        prompt = _TMPL_SEARCH_QUERIES.format_map({
+            "problem_description": problem_description,
+            "target_audience_line": f"Target Audience: {target_audience}" if target_audience else "",
+            "num_queries": num_queries
+        })
+        
+        # Query lists are kept for a day so repeat analyses skip Claude entirely
+        queries_key = self._get_cache_key(prompt, kind="search_queries")
+        if self._disk_cache is not None:
+            cached_queries = self._disk_cache.get(queries_key)
+            if cached_queries is not None:
+                return cached_queries
         
         try:
-            response = self.generate_response(
+            response = self.generate_response_streamed(
                 prompt=prompt,
-                system_prompt="You are an expert at search query optimization. Return only valid JSON arrays.",
+                system_prompt=_SYSTEM_SEARCH_QUERIES,
                 temperature=0.7,
                 max_tokens=2000
             )
             
             # Track API cost - this is part of pain research
-            if "cost" in response:
-                import streamlit as st
-                if "api_costs" in st.session_state:
-                    st.session_state.api_costs["pain_research"] += response["cost"]
-                    st.session_state.api_costs["total"] += response["cost"]
+            if "cost" in response and _HAS_STREAMLIT and "api_costs" in st.session_state:
+                st.session_state.api_costs["pain_research"] += response["cost"]
+                st.session_state.api_costs["total"] += response["cost"]
             
             # Parse the response - handle cases where Claude adds explanation
             content = response["content"].strip()
@@ -432,9 +674,8 @@ Return ONLY a JSON array of SIMPLE search query strings. Make them broad enough
             # Remove markdown code blocks if present
             if content.startswith('```'):
                 # Remove ```json or ```
-                import re
-                content = re.sub(r'^```(?:json)?\s*', '', content)
-                content = re.sub(r'\s*```$', '', content)
+                content = _FENCE_OPEN.sub('', content)
+                content = _FENCE_CLOSE.sub('', content)
                 content = content.strip()
             
             # Try to extract JSON array from the response
@@ -443,28 +684,26 @@ Return ONLY a JSON array of SIMPLE search query strings. Make them broad enough
                 queries = json.loads(content)
             else:
                 # Look for JSON array in the response
-                import re
-                json_match = re.search(r'\[[\s\S]*\]', content)
+                json_match = _JSON_ARRAY.search(content)
                 if json_match:
                     queries = json.loads(json_match.group())
                 else:
-                    # Try to find lines that look like queries
-                    lines = content.split('\n')
-                    queries = []
-                    for line in lines:
-                        line = line.strip()
-                        if line and (line.startswith('"') or line.startswith("'")):
-                            # Remove quotes and commas
-                            query = line.strip('"\',[]\\t ')
-                            if query:
-                                queries.append(query)
+                    # Fall back to lines that hold a single quoted query
+                    queries = [
+                        _ESCAPED_CHAR.sub(r'\1', query.strip())
+                        for _, query in _QUOTED_LINE.findall(content)
+                        if query.strip()
+                    ]
                     
                     if not queries:
                         raise ValueError(f"Could not parse queries from response: {content[:200]}")
             
             # Validate it's a list of strings
             if isinstance(queries, list) and all(isinstance(q, str) for q in queries):
-                return queries[:num_queries]
+                queries = queries[:num_queries]
+                if self._disk_cache is not None:
+                    self._disk_cache.set(queries_key, queries, expire=QUERY_CACHE_TTL)
+                return queries
             else:
                 raise ValueError(f"Invalid response format. Got: {type(queries)}")
                 
@@ -485,49 +724,36 @@ Return ONLY a JSON array of SIMPLE search query strings. Make them broad enough
         pain_points: List[str]
     ) -> List[str]:
         """Generate search queries to find competitors based on pain points."""
-        prompt = f"""Based on this problem and the pain points discovered, generate search queries to find existing solutions and competitors.
-
-Problem: {problem}
-
-Pain Points:
-{chr(10).join(f'- {point}' for point in pain_points)}
-
-Generate 15 search queries that will help find:
-1. Existing software/tools that solve these pain points
-2. Companies providing solutions to these problems
-3. Alternatives people are using
-
-Think about:
-- What would someone search for when looking for a solution to these pain points?
-- What keywords would existing solutions use in their marketing?
-- What terms would appear on competitor websites?
-
-Return ONLY a JSON array of search query strings. Keep queries simple and focused.
-
-Examples of good queries:
-- "automated invoice processing software"
-- "customer feedback management platform"
-- "marketing automation tools pricing"
-
-Return the queries as a JSON array."""
+        prompt = _TMPL_COMPETITOR_QUERIES.format_map({
+            "problem": problem,
+            "pain_points_list": "\n".join(f"- {point}" for point in pain_points)
+        })
+        
+        # Query lists are kept for a day so repeat analyses skip Claude entirely
+        queries_key = self._get_cache_key(prompt, kind="competitor_queries")
+        if self._disk_cache is not None:
+            cached_queries = self._disk_cache.get(queries_key)
+            if cached_queries is not None:
+                return cached_queries
         
         try:
-            response = self.generate_response(
+            response = self.generate_response_streamed(
                 prompt=prompt,
-                system_prompt="You are an expert at competitive intelligence and market research. Return only valid JSON arrays.",
+                system_prompt=_SYSTEM_COMPETITOR_QUERIES,
                 temperature=0.7
             )
             
-            # Parse response
-            content = response["content"].strip()
-            if content.startswith('```'):
-                content = re.sub(r'^```(?:json)?\s*', '', content)
-                content = re.sub(r'\s*```$', '', content)
-                content = content.strip()
+            # Track API cost - this is part of market analysis
+            if "cost" in response and _HAS_STREAMLIT and "api_costs" in st.session_state:
+                st.session_state.api_costs["market_analysis"] += response["cost"]
+                st.session_state.api_costs["total"] += response["cost"]
             
-            queries = json.loads(content)
+            queries = _loads_lenient(response["content"])
             if isinstance(queries, list) and all(isinstance(q, str) for q in queries):
-                return queries[:15]
+                queries = queries[:15]
+                if self._disk_cache is not None:
+                    self._disk_cache.set(queries_key, queries, expire=QUERY_CACHE_TTL)
+                return queries
             else:
                 raise ValueError("Invalid response format")
                 
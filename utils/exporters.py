@@ -1,20 +1,323 @@
 """Export utilities for generating reports in various formats."""
-import json
+import atexit
 import csv
+import gzip
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
+import orjson
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image, HRFlowable
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image, HRFlowable, Flowable
 from reportlab.platypus.tableofcontents import TableOfContents
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
 
 from config.settings import EXPORT_DIR
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Parts of the PDF report, in document order
+PDF_SECTIONS = (
+    "title",
+    "summary",
+    "toc",
+    "pain_research",
+    "market_analysis",
+    "content_generation",
+    "survey_analysis",
+    "recommendation"
+)
+
+# Executive summary pass/fail metrics:
+# (label, (results section, key), scale, threshold, score format, threshold text)
+SUMMARY_METRICS = (
+    ('Overall Viability', ('summary', 'viability_score'), 1, 7, '{}/10', '≥ 7/10'),
+    ('Pain Score', ('pain_research', 'pain_score'), 1, 7, '{}/10', '≥ 7/10'),
+    ('Market Opportunity', ('market_analysis', 'opportunity_score'), 1, 6, '{}/10', '≥ 6/10'),
+    ('Predicted Conversion', ('content_generation', 'predicted_conversion'), 100, 2, '{:.1f}%', '≥ 2%'),
+    ('Average WTP', ('survey_analysis', 'avg_wtp'), 1, 50, '${}/mo', '≥ $50/mo'),
+)
+
+# Report palette, parsed once at import
+_BRAND_RED = colors.HexColor('#FF4B4B')
+_DARK_GREY = colors.HexColor('#333333')
+_HEADING_GREY = colors.HexColor('#444444')
+_QUOTE_GREY = colors.HexColor('#555555')
+_SUBTITLE_GREY = colors.HexColor('#666666')
+_RULE_GREY = colors.HexColor('#CCCCCC')
+_LABEL_BG = colors.HexColor('#F0F0F0')
+_ROW_ALT_BG = colors.HexColor('#F5F5F5')
+_ROW_BG = colors.HexColor('#F8F8F8')
+_GO_BG = colors.HexColor('#E8F5E9')
+_NO_GO_BG = colors.HexColor('#FFEBEE')
+
+# Background workers for exports; shared because Streamlit creates a new
+# ReportExporter on every rerun
+_EXPORT_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="report-export")
+atexit.register(_EXPORT_EXECUTOR.shutdown)
+
+# Table styles shared by every export
+_SIDE_METRICS_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), _LABEL_BG),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+
+_LISTING_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _BRAND_RED),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BACKGROUND', (0, 1), (-1, -1), _ROW_BG),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+
+_STRENGTHS_RISKS_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+])
+
+
+def _recommendation_box_style(background, border):
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), background),
+        ('BOX', (0, 0), (-1, -1), 2, border),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('TOPPADDING', (0, 0), (-1, -1), 20),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
+    ])
+
+
+_GO_BOX_STYLE = _recommendation_box_style(_GO_BG, colors.green)
+_NO_GO_BOX_STYLE = _recommendation_box_style(_NO_GO_BG, colors.red)
+
+
+@lru_cache(maxsize=1)
+def _get_custom_styles():
+    """Create custom styles for the PDF, built once and shared across exports."""
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Title'],
+        fontSize=32,
+        textColor=_BRAND_RED,
+        spaceAfter=40,
+        alignment=TA_CENTER
+    ))
+    
+    # Subtitle style
+    styles.add(ParagraphStyle(
+        name='Subtitle',
+        parent=styles['Heading2'],
+        fontSize=18,
+        textColor=_SUBTITLE_GREY,
+        spaceAfter=20,
+        alignment=TA_CENTER
+    ))
+    
+    # Section header style
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=_DARK_GREY,
+        spaceAfter=20,
+        borderWidth=0,
+        borderPadding=0,
+        borderColor=_BRAND_RED,
+        borderRadius=0
+    ))
+    
+    # Subsection style
+    styles.add(ParagraphStyle(
+        name='Subsection',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=_HEADING_GREY,
+        spaceAfter=12,
+        spaceBefore=12
+    ))
+    
+    # Metric style
+    styles.add(ParagraphStyle(
+        name='Metric',
+        parent=styles['Normal'],
+        fontSize=14,
+        alignment=TA_CENTER,
+        textColor=_DARK_GREY
+    ))
+    
+    # Score style
+    styles.add(ParagraphStyle(
+        name='Score',
+        parent=styles['Normal'],
+        fontSize=20,
+        alignment=TA_CENTER,
+        textColor=_BRAND_RED,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Table of contents entry style
+    styles.add(ParagraphStyle(
+        name='TOCLevel0',
+        parent=styles['Normal'],
+        fontSize=12,
+        leading=20
+    ))
+    
+    # Representative quote style
+    styles.add(ParagraphStyle(
+        name='Quote',
+        parent=styles['Normal'],
+        leftIndent=20,
+        rightIndent=20,
+        textColor=_QUOTE_GREY,
+        fontSize=10,
+        leading=14
+    ))
+    
+    # Landing page headline style
+    styles.add(ParagraphStyle(
+        name='Headline',
+        parent=styles['Normal'],
+        fontSize=16,
+        fontName='Helvetica-Bold',
+        spaceAfter=10
+    ))
+    
+    # Recommendation styles, one per verdict
+    for suffix, color in (('Go', colors.green), ('NoGo', colors.red)):
+        styles.add(ParagraphStyle(
+            name=f'Rec{suffix}',
+            parent=styles['Normal'],
+            fontSize=18,
+            textColor=color,
+            alignment=TA_CENTER,
+            spaceAfter=20
+        ))
+        styles.add(ParagraphStyle(
+            name=f'RecBox{suffix}',
+            fontSize=28,
+            fontName='Helvetica-Bold',
+            alignment=TA_CENTER,
+            textColor=color
+        ))
+    
+    styles.add(ParagraphStyle(
+        name='RecBoxSub',
+        fontSize=14,
+        alignment=TA_CENTER,
+        textColor=_QUOTE_GREY
+    ))
+    
+    return styles
+
+
+class _FastTable(Flowable):
+    """Fixed-layout table of short, single-line cells drawn straight onto the canvas.
+    
+    Skips Table's per-cell measuring and style resolution, which dominates the
+    cost of the small fixed-schema tables in the report. Cells are not wrapped.
+    """
+    
+    def __init__(
+        self,
+        rows: List[List[str]],
+        col_widths: List[float],
+        header_fill,
+        header_text_color=colors.black,
+        row_fills=(colors.white,),
+        header_font_size: int = 10,
+        font_size: int = 10,
+        padding: float = 6,
+        first_col_left: bool = False,
+        box: bool = False
+    ):
+        super().__init__()
+        self.rows = rows
+        self.col_widths = col_widths
+        self.header_fill = header_fill
+        self.header_text_color = header_text_color
+        self.row_fills = row_fills
+        self.header_font_size = header_font_size
+        self.font_size = font_size
+        self.padding = padding
+        self.first_col_left = first_col_left
+        self.box = box
+        
+        self.header_height = header_font_size * 1.2 + 2 * padding
+        self.row_height = font_size * 1.2 + 2 * padding
+        self.width = sum(col_widths)
+        self.height = self.header_height + self.row_height * (len(rows) - 1)
+        
+        # Cell boundaries, computed once for fills, text and grid lines
+        self.xs = [0]
+        for col_width in col_widths:
+            self.xs.append(self.xs[-1] + col_width)
+        self.ys = [self.height, self.height - self.header_height]
+        for _ in rows[1:]:
+            self.ys.append(self.ys[-1] - self.row_height)
+    
+    def wrap(self, available_width, available_height):
+        return self.width, self.height
+    
+    def draw(self):
+        canv = self.canv
+        xs, ys = self.xs, self.ys
+        
+        for r, row in enumerate(self.rows):
+            top, bottom = ys[r], ys[r + 1]
+            if r == 0:
+                fill, text_color = self.header_fill, self.header_text_color
+                font, font_size = 'Helvetica-Bold', self.header_font_size
+            else:
+                fill, text_color = self.row_fills[(r - 1) % len(self.row_fills)], colors.black
+                font, font_size = 'Helvetica', self.font_size
+            
+            canv.setFillColor(fill)
+            canv.rect(0, bottom, self.width, top - bottom, stroke=0, fill=1)
+            
+            canv.setFillColor(text_color)
+            canv.setFont(font, font_size)
+            baseline = bottom + self.padding + font_size * 0.2
+            for c, text in enumerate(row):
+                if c == 0 and r and self.first_col_left:
+                    canv.drawString(xs[0] + 6, baseline, text)
+                else:
+                    canv.drawCentredString((xs[c] + xs[c + 1]) / 2, baseline, text)
+        
+        canv.setStrokeColor(colors.grey)
+        canv.setLineWidth(0.5)
+        canv.grid(xs, ys)
+        if self.box:
+            canv.setStrokeColor(colors.black)
+            canv.setLineWidth(1)
+            canv.rect(0, 0, self.width, self.height, stroke=1, fill=0)
+
+
+class _ReportDocTemplate(SimpleDocTemplate):
+    """Document template that reports section headers to the table of contents."""
+    
+    def afterFlowable(self, flowable):
+        if isinstance(flowable, Paragraph) and flowable.style.name == 'SectionHeader':
+            text = flowable.getPlainText()
+            if text != "Table of Contents":
+                self.notify('TOCEntry', (0, text, self.page))
+
 
 class ReportExporter:
     """Handle exporting validation results in various formats."""
@@ -27,18 +330,43 @@ class ReportExporter:
     def export_to_pdf(
         self,
         results: Dict[str, Any],
-        filename: str = None
+        filename: str = None,
+        sections: Iterable[str] = None
     ) -> Path:
-        """Export results to PDF format."""
+        """Export results to PDF format.
+        
+        sections limits the report to the named parts of PDF_SECTIONS; by
+        default the full report is built.
+        """
+        if not sections:
+            sections = PDF_SECTIONS
+        else:
+            requested = set(sections)
+            unknown = requested - set(PDF_SECTIONS)
+            if unknown:
+                raise ValueError(f"Unknown PDF sections: {', '.join(sorted(unknown))}")
+            sections = tuple(section for section in PDF_SECTIONS if section in requested)
+        
+        # One timestamp for both the filename and the title page
+        now = datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"validation_report_{timestamp}.pdf"
+            filename = f"validation_report_{now.strftime('%Y%m%d_%H%M%S')}.pdf"
         
         filepath = self.export_dir / filename
-        
+        self._build_pdf(results, str(filepath), sections, now.strftime('%B %d, %Y at %I:%M %p'))
+        return filepath
+    
+    def _build_pdf(
+        self,
+        results: Dict[str, Any],
+        filepath: str,
+        sections: Tuple[str, ...],
+        generated_at: str
+    ):
+        """Render the requested report sections to filepath."""
         # Create PDF document with better formatting
-        doc = SimpleDocTemplate(
-            str(filepath),
+        doc = _ReportDocTemplate(
+            filepath,
             pagesize=letter,
             rightMargin=72,
             leftMargin=72,
@@ -50,116 +378,76 @@ class ReportExporter:
         
         # Container for flowable objects
         elements = []
-        styles = self._get_custom_styles()
+        styles = _get_custom_styles()
+        
+        def new_page():
+            # Every section after the first starts on its own page
+            if elements:
+                elements.append(PageBreak())
         
         # Add title page
-        self._add_title_page(elements, results, styles)
+        if "title" in sections:
+            self._add_title_page(elements, results, styles, generated_at)
         
         # Add executive summary with metrics dashboard
-        self._add_executive_summary(elements, results, styles)
+        if "summary" in sections:
+            new_page()
+            self._add_executive_summary(elements, results, styles)
         
         # Add table of contents
-        elements.append(PageBreak())
-        self._add_table_of_contents(elements, styles)
-        
-        # Pain Research Results
-        if "pain_research" in results:
-            elements.append(PageBreak())
-            self._add_pain_research_section(elements, results["pain_research"], styles)
-        
-        # Market Analysis Results
-        if "market_analysis" in results:
-            elements.append(PageBreak())
-            self._add_market_analysis_section(elements, results["market_analysis"], styles)
-        
-        # Content Generation Results
-        if "content_generation" in results:
-            elements.append(PageBreak())
-            self._add_content_generation_section(elements, results["content_generation"], styles)
-        
-        # Survey Analysis Results
-        if "survey_analysis" in results:
-            elements.append(PageBreak())
-            self._add_survey_analysis_section(elements, results["survey_analysis"], styles)
+        if "toc" in sections:
+            new_page()
+            self._add_table_of_contents(elements, styles)
+        
+        # Stage results, each only when that stage ran
+        for section, add_section in (
+            ("pain_research", self._add_pain_research_section),
+            ("market_analysis", self._add_market_analysis_section),
+            ("content_generation", self._add_content_generation_section),
+            ("survey_analysis", self._add_survey_analysis_section)
+        ):
+            if section in sections and section in results:
+                new_page()
+                add_section(elements, results[section], styles)
         
         # Final Recommendation
-        elements.append(PageBreak())
-        self._add_final_recommendation(elements, results, styles)
-        
-        # Build PDF
-        doc.build(elements)
+        if "recommendation" in sections:
+            new_page()
+            self._add_final_recommendation(elements, results, styles)
         
-        return filepath
+        # Build PDF; multiBuild reruns layout until the table of contents page numbers settle
+        doc.multiBuild(elements)
     
-    def _get_custom_styles(self):
-        """Create custom styles for the PDF."""
-        styles = getSampleStyleSheet()
-        
-        # Title style
-        styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=styles['Title'],
-            fontSize=32,
-            textColor=colors.HexColor('#FF4B4B'),
-            spaceAfter=40,
-            alignment=TA_CENTER
-        ))
-        
-        # Subtitle style
-        styles.add(ParagraphStyle(
-            name='Subtitle',
-            parent=styles['Heading2'],
-            fontSize=18,
-            textColor=colors.HexColor('#666666'),
-            spaceAfter=20,
-            alignment=TA_CENTER
-        ))
-        
-        # Section header style
-        styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#333333'),
-            spaceAfter=20,
-            borderWidth=0,
-            borderPadding=0,
-            borderColor=colors.HexColor('#FF4B4B'),
-            borderRadius=0
-        ))
-        
-        # Subsection style
-        styles.add(ParagraphStyle(
-            name='Subsection',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#444444'),
-            spaceAfter=12,
-            spaceBefore=12
-        ))
-        
-        # Metric style
-        styles.add(ParagraphStyle(
-            name='Metric',
-            parent=styles['Normal'],
-            fontSize=14,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#333333')
-        ))
-        
-        # Score style
-        styles.add(ParagraphStyle(
-            name='Score',
-            parent=styles['Normal'],
-            fontSize=20,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#FF4B4B'),
-            fontName='Helvetica-Bold'
-        ))
+    def export_to_pdf_async(
+        self,
+        results: Dict[str, Any],
+        filename: str = None,
+        sections: Iterable[str] = None
+    ) -> Future:
+        """Start a PDF export in the background and return a Future of its path."""
+        return _EXPORT_EXECUTOR.submit(self.export_to_pdf, results, filename, sections)
+    
+    def export_all(
+        self,
+        results: Dict[str, Any],
+        basename: str = None
+    ) -> Dict[str, Path]:
+        """Export results to PDF, CSV and JSON concurrently.
+        
+        Returns a dict mapping each format ("pdf", "csv", "json") to its file path.
+        """
+        if not basename:
+            basename = f"validation_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        
+        futures = {
+            _EXPORT_EXECUTOR.submit(self.export_to_pdf, results, f"{basename}_report.pdf"): "pdf",
+            _EXPORT_EXECUTOR.submit(self.export_to_csv, results, f"{basename}_data.csv"): "csv",
+            _EXPORT_EXECUTOR.submit(self.export_to_json, results, f"{basename}_results.json"): "json"
+        }
         
-        return styles
+        return {futures[future]: future.result() for future in as_completed(futures)}
     
-    def _add_title_page(self, elements: List, results: Dict[str, Any], styles):
+    def _add_title_page(self, elements: List, results: Dict[str, Any], styles, generated_at: str):
         """Add a professional title page."""
         # Add spacing
         elements.append(Spacer(1, 2*inch))
@@ -181,15 +469,14 @@ class ReportExporter:
             elements.append(Spacer(1, 1*inch))
         
         # Report metadata
-        elements.append(HRFlowable(width="80%", thickness=1, color=colors.HexColor('#CCCCCC'), spaceBefore=10, spaceAfter=10))
+        elements.append(HRFlowable(width="80%", thickness=1, color=_RULE_GREY, spaceBefore=10, spaceAfter=10))
         
         # Date
-        elements.append(Paragraph(f"Report Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", styles['Normal']))
+        elements.append(Paragraph(f"Report Generated: {generated_at}", styles['Normal']))
         elements.append(Paragraph("Powered by AI-Powered Kill Switch", styles['Normal']))
     
     def _add_executive_summary(self, elements: List, results: Dict[str, Any], styles):
         """Add executive summary with metrics dashboard."""
-        elements.append(PageBreak())
         elements.append(Paragraph("Executive Summary", styles['SectionHeader']))
         elements.append(Spacer(1, 0.3*inch))
         
@@ -198,20 +485,12 @@ class ReportExporter:
         recommendation = summary.get("recommendation", "UNKNOWN")
         
         if recommendation == "GO":
-            rec_color = colors.green
+            rec_style = styles['RecGo']
             rec_text = "✅ GO - This idea shows strong potential"
         else:
-            rec_color = colors.red
+            rec_style = styles['RecNoGo']
             rec_text = "❌ NO-GO - This idea needs significant refinement"
         
-        rec_style = ParagraphStyle(
-            'RecStyle',
-            parent=styles['Normal'],
-            fontSize=18,
-            textColor=rec_color,
-            alignment=TA_CENTER,
-            spaceAfter=20
-        )
         elements.append(Paragraph(rec_text, rec_style))
         
         # Reasoning
@@ -223,81 +502,28 @@ class ReportExporter:
         elements.append(Paragraph("Key Metrics", styles['Subsection']))
         
         # Create metrics table
-        metrics_data = []
-        
-        # Header row
-        metrics_data.append(['Metric', 'Score', 'Status', 'Threshold'])
-        
-        # Viability Score
-        viability = summary.get('viability_score', 0)
-        metrics_data.append([
-            'Overall Viability',
-            f'{viability}/10',
-            '✅ Pass' if viability >= 7 else '❌ Fail',
-            '≥ 7/10'
-        ])
-        
-        # Pain Score
-        pain_score = results.get("pain_research", {}).get("pain_score", 0)
-        metrics_data.append([
-            'Pain Score',
-            f'{pain_score}/10',
-            '✅ Pass' if pain_score >= 7 else '❌ Fail',
-            '≥ 7/10'
-        ])
-        
-        # Market Opportunity
-        opp_score = results.get("market_analysis", {}).get("opportunity_score", 0)
-        metrics_data.append([
-            'Market Opportunity',
-            f'{opp_score}/10',
-            '✅ Pass' if opp_score >= 6 else '❌ Fail',
-            '≥ 6/10'
-        ])
-        
-        # Conversion Rate
-        conv_rate = results.get("content_generation", {}).get("predicted_conversion", 0) * 100
-        metrics_data.append([
-            'Predicted Conversion',
-            f'{conv_rate:.1f}%',
-            '✅ Pass' if conv_rate >= 2 else '❌ Fail',
-            '≥ 2%'
-        ])
-        
-        # Average WTP
-        avg_wtp = results.get("survey_analysis", {}).get("avg_wtp", 0)
-        metrics_data.append([
-            'Average WTP',
-            f'${avg_wtp}/mo',
-            '✅ Pass' if avg_wtp >= 50 else '❌ Fail',
-            '≥ $50/mo'
-        ])
+        metrics_data = [['Metric', 'Score', 'Status', 'Threshold']]
+        for label, (section, key), scale, threshold, score_format, threshold_text in SUMMARY_METRICS:
+            value = results.get(section, {}).get(key, 0) * scale
+            metrics_data.append([
+                label,
+                score_format.format(value),
+                '✅ Pass' if value >= threshold else '❌ Fail',
+                threshold_text
+            ])
         
         # Create and style the table
-        metrics_table = Table(metrics_data, colWidths=[2.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-        metrics_table.setStyle(TableStyle([
-            # Header row
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#FF4B4B')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            
-            # Data rows
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F8F8F8')),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
-            
-            # Borders
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('BOX', (0, 0), (-1, -1), 1, colors.black),
-            
-            # Padding
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
+        metrics_table = _FastTable(
+            metrics_data,
+            [2.5*inch, 1.5*inch, 1.5*inch, 1.5*inch],
+            header_fill=_BRAND_RED,
+            header_text_color=colors.whitesmoke,
+            row_fills=(_ROW_BG,),
+            header_font_size=12,
+            padding=8,
+            first_col_left=True,
+            box=True
+        )
         
         elements.append(metrics_table)
         elements.append(Spacer(1, 0.3*inch))
@@ -309,43 +535,25 @@ class ReportExporter:
             risks = summary.get("risks", [])
             
             # Create two columns
-            strengths_text = "<b>✅ Strengths</b><br/><br/>"
-            for strength in strengths[:5]:
-                strengths_text += f"• {strength}<br/>"
-            
-            risks_text = "<b>⚠️ Risks</b><br/><br/>"
-            for risk in risks[:5]:
-                risks_text += f"• {risk}<br/>"
+            strengths_text = "<b>✅ Strengths</b><br/><br/>" + "".join(f"• {strength}<br/>" for strength in strengths[:5])
+            risks_text = "<b>⚠️ Risks</b><br/><br/>" + "".join(f"• {risk}<br/>" for risk in risks[:5])
             
             sr_table = Table([[Paragraph(strengths_text, styles['Normal']), 
                              Paragraph(risks_text, styles['Normal'])]], 
                            colWidths=[3.5*inch, 3.5*inch])
-            sr_table.setStyle(TableStyle([
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 10),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-            ]))
+            sr_table.setStyle(_STRENGTHS_RISKS_STYLE)
             
             elements.append(sr_table)
     
     def _add_table_of_contents(self, elements: List, styles):
-        """Add table of contents."""
+        """Add table of contents, filled in from section headers during the build."""
         elements.append(Paragraph("Table of Contents", styles['SectionHeader']))
         elements.append(Spacer(1, 0.3*inch))
         
-        toc_items = [
-            ("Executive Summary", "2"),
-            ("Pain Research Analysis", "4"),
-            ("Market Analysis", "5"),
-            ("Content & Messaging", "6"),
-            ("Survey Analysis", "7"),
-            ("Final Recommendation", "8")
-        ]
-        
-        for item, page in toc_items:
-            toc_line = f'<para>{item}{"." * 50}{page}</para>'
-            elements.append(Paragraph(toc_line, styles['Normal']))
-            elements.append(Spacer(1, 0.1*inch))
+        toc = TableOfContents()
+        toc.levelStyles = [styles['TOCLevel0']]
+        toc.dotsMinLevel = 0  # Dot leaders for top-level entries too
+        elements.append(toc)
     
     def _add_pain_research_section(self, elements: List, data: Dict[str, Any], styles):
         """Add pain research section with better formatting."""
@@ -378,19 +586,15 @@ class ReportExporter:
                 
                 threshold_data.append([level_names[level], status, complaints, pain_score, details])
             
-            threshold_table = Table(threshold_data, colWidths=[2.2*inch, 0.8*inch, 1.2*inch, 1.2*inch, 2.1*inch])
-            threshold_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#333333')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ]))
+            threshold_table = _FastTable(
+                threshold_data,
+                [2.2*inch, 0.8*inch, 1.2*inch, 1.2*inch, 2.1*inch],
+                header_fill=_DARK_GREY,
+                header_text_color=colors.whitesmoke,
+                row_fills=(colors.white, _ROW_ALT_BG),
+                font_size=9,
+                padding=8
+            )
             
             elements.append(threshold_table)
             elements.append(Spacer(1, 0.3*inch))
@@ -400,28 +604,25 @@ class ReportExporter:
             elements.append(Paragraph("Complaint Quality Analysis", styles['Subsection']))
             
             breakdown = data['complaint_breakdown']
+            total = max(breakdown.get('total_analyzed', 1), 1)
+            tier_3, tier_2, tier_1, tier_0 = (
+                breakdown.get(key, 0)
+                for key in ('tier_3_high_impact', 'tier_2_moderate', 'tier_1_low_value', 'tier_0_not_complaints')
+            )
             quality_data = [
                 ['Category', 'Count', 'Percentage'],
-                ['🔴 High-Impact Complaints', str(breakdown.get('tier_3_high_impact', 0)), 
-                 f"{(breakdown.get('tier_3_high_impact', 0) / max(breakdown.get('total_analyzed', 1), 1)) * 100:.1f}%"],
-                ['🟡 Moderate Complaints', str(breakdown.get('tier_2_moderate', 0)),
-                 f"{(breakdown.get('tier_2_moderate', 0) / max(breakdown.get('total_analyzed', 1), 1)) * 100:.1f}%"],
-                ['🟢 Low-Value Signals', str(breakdown.get('tier_1_low_value', 0)),
-                 f"{(breakdown.get('tier_1_low_value', 0) / max(breakdown.get('total_analyzed', 1), 1)) * 100:.1f}%"],
-                ['⚪ Not Complaints', str(breakdown.get('tier_0_not_complaints', 0)),
-                 f"{(breakdown.get('tier_0_not_complaints', 0) / max(breakdown.get('total_analyzed', 1), 1)) * 100:.1f}%"]
+                ['🔴 High-Impact Complaints', str(tier_3), f"{tier_3 / total * 100:.1f}%"],
+                ['🟡 Moderate Complaints', str(tier_2), f"{tier_2 / total * 100:.1f}%"],
+                ['🟢 Low-Value Signals', str(tier_1), f"{tier_1 / total * 100:.1f}%"],
+                ['⚪ Not Complaints', str(tier_0), f"{tier_0 / total * 100:.1f}%"]
             ]
             
-            quality_table = Table(quality_data, colWidths=[3*inch, 1.5*inch, 1.5*inch])
-            quality_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F0F0F0')),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ]))
+            quality_table = _FastTable(
+                quality_data,
+                [3*inch, 1.5*inch, 1.5*inch],
+                header_fill=_LABEL_BG,
+                first_col_left=True
+            )
             
             elements.append(quality_table)
             elements.append(Spacer(1, 0.3*inch))
@@ -435,14 +636,7 @@ class ReportExporter:
         ]
         
         metrics_table = Table(metrics_table_data, colWidths=[2*inch, 2*inch])
-        metrics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F0F0F0')),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        metrics_table.setStyle(_SIDE_METRICS_STYLE)
         
         elements.append(metrics_table)
         elements.append(Spacer(1, 0.3*inch))
@@ -450,23 +644,15 @@ class ReportExporter:
         # Key themes
         if data.get('themes'):
             elements.append(Paragraph("Key Pain Themes", styles['Subsection']))
-            for i, theme in enumerate(data['themes'][:5], 1):
-                elements.append(Paragraph(f"{i}. {theme}", styles['Normal']))
+            themes = "<br/>".join(f"{i}. {theme}" for i, theme in enumerate(data['themes'][:5], 1))
+            elements.append(Paragraph(themes, styles['Normal']))
             elements.append(Spacer(1, 0.2*inch))
         
         # Key quotes
         if data.get('key_quotes'):
             elements.append(Paragraph("Representative Quotes", styles['Subsection']))
+            quote_style = styles['Quote']
             for quote in data['key_quotes'][:3]:
-                quote_style = ParagraphStyle(
-                    'Quote',
-                    parent=styles['Normal'],
-                    leftIndent=20,
-                    rightIndent=20,
-                    textColor=colors.HexColor('#555555'),
-                    fontSize=10,
-                    leading=14
-                )
                 # Handle both string quotes and dict quotes
                 if isinstance(quote, dict):
                     quote_text = quote.get('text', quote.get('quote', str(quote)))
@@ -494,14 +680,7 @@ class ReportExporter:
         ]
         
         metrics_table = Table(metrics_table_data, colWidths=[2*inch, 2*inch])
-        metrics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F0F0F0')),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        metrics_table.setStyle(_SIDE_METRICS_STYLE)
         
         elements.append(metrics_table)
         elements.append(Spacer(1, 0.3*inch))
@@ -542,17 +721,7 @@ class ReportExporter:
                 ])
             
             comp_table = Table(comp_data, colWidths=[2*inch, 1.5*inch, 3.5*inch])
-            comp_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#FF4B4B')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F8F8F8')),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ]))
+            comp_table.setStyle(_LISTING_TABLE_STYLE)
             
             elements.append(comp_table)
             elements.append(Spacer(1, 0.2*inch))
@@ -560,8 +729,8 @@ class ReportExporter:
         # Market gaps
         if data.get('gaps'):
             elements.append(Paragraph("Market Gaps & Opportunities", styles['Subsection']))
-            for gap in data['gaps'][:5]:
-                elements.append(Paragraph(f"• {gap}", styles['Normal']))
+            gaps = "<br/>".join(f"• {gap}" for gap in data['gaps'][:5])
+            elements.append(Paragraph(gaps, styles['Normal']))
     
     def _add_content_generation_section(self, elements: List, data: Dict[str, Any], styles):
         """Add content generation section."""
@@ -577,14 +746,7 @@ class ReportExporter:
         ]
         
         metrics_table = Table(metrics_table_data, colWidths=[2*inch, 2*inch])
-        metrics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F0F0F0')),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        metrics_table.setStyle(_SIDE_METRICS_STYLE)
         
         elements.append(metrics_table)
         elements.append(Spacer(1, 0.3*inch))
@@ -596,14 +758,7 @@ class ReportExporter:
             
             # Headline and subheadline
             if landing_page.get('headline'):
-                headline_style = ParagraphStyle(
-                    'Headline',
-                    parent=styles['Normal'],
-                    fontSize=16,
-                    fontName='Helvetica-Bold',
-                    spaceAfter=10
-                )
-                elements.append(Paragraph(landing_page['headline'], headline_style))
+                elements.append(Paragraph(landing_page['headline'], styles['Headline']))
             
             if landing_page.get('subheadline'):
                 elements.append(Paragraph(landing_page['subheadline'], styles['Normal']))
@@ -614,17 +769,17 @@ class ReportExporter:
                 elements.append(Paragraph("Key Benefits:", styles['Normal']))
                 benefits = landing_page['benefits']
                 if isinstance(benefits, list):
-                    for benefit in benefits:
-                        elements.append(Paragraph(f"✓ {benefit}", styles['Normal']))
+                    benefits = "<br/>".join(f"✓ {benefit}" for benefit in benefits)
                 else:
-                    elements.append(Paragraph(f"✓ {benefits}", styles['Normal']))
+                    benefits = f"✓ {benefits}"
+                elements.append(Paragraph(benefits, styles['Normal']))
                 elements.append(Spacer(1, 0.2*inch))
         
         # Improvement suggestions
         if data.get('improvement_suggestions'):
             elements.append(Paragraph("Improvement Suggestions", styles['Subsection']))
-            for suggestion in data['improvement_suggestions'][:3]:
-                elements.append(Paragraph(f"• {suggestion}", styles['Normal']))
+            suggestions = "<br/>".join(f"• {suggestion}" for suggestion in data['improvement_suggestions'][:3])
+            elements.append(Paragraph(suggestions, styles['Normal']))
     
     def _add_survey_analysis_section(self, elements: List, data: Dict[str, Any], styles):
         """Add survey analysis section."""
@@ -640,14 +795,7 @@ class ReportExporter:
         ]
         
         metrics_table = Table(metrics_table_data, colWidths=[2*inch, 2*inch])
-        metrics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F0F0F0')),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        metrics_table.setStyle(_SIDE_METRICS_STYLE)
         
         elements.append(metrics_table)
         elements.append(Spacer(1, 0.3*inch))
@@ -661,17 +809,7 @@ class ReportExporter:
                 dist_data.append([range_name, f"{percentage}%"])
             
             dist_table = Table(dist_data, colWidths=[3*inch, 1.5*inch])
-            dist_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#FF4B4B')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F8F8F8')),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ]))
+            dist_table.setStyle(_LISTING_TABLE_STYLE)
             
             elements.append(dist_table)
             elements.append(Spacer(1, 0.2*inch))
@@ -679,8 +817,8 @@ class ReportExporter:
         # Top requested features
         if data.get('top_features'):
             elements.append(Paragraph("Most Requested Features", styles['Subsection']))
-            for i, feature in enumerate(data['top_features'][:5], 1):
-                elements.append(Paragraph(f"{i}. {feature}", styles['Normal']))
+            features = "<br/>".join(f"{i}. {feature}" for i, feature in enumerate(data['top_features'][:5], 1))
+            elements.append(Paragraph(features, styles['Normal']))
     
     def _add_final_recommendation(self, elements: List, results: Dict[str, Any], styles):
         """Add final recommendation section."""
@@ -692,38 +830,24 @@ class ReportExporter:
         
         # Big decision box
         if recommendation == "GO":
-            rec_bg_color = colors.HexColor('#E8F5E9')
-            rec_border_color = colors.green
+            rec_box_style = _GO_BOX_STYLE
+            rec_text_style = styles['RecBoxGo']
             rec_text = "✅ GO"
             rec_subtitle = "This idea shows strong potential and is worth pursuing"
         else:
-            rec_bg_color = colors.HexColor('#FFEBEE')
-            rec_border_color = colors.red
+            rec_box_style = _NO_GO_BOX_STYLE
+            rec_text_style = styles['RecBoxNoGo']
             rec_text = "❌ NO-GO"
             rec_subtitle = "This idea needs significant refinement before proceeding"
         
         # Create recommendation box
-        rec_data = [[Paragraph(rec_text, ParagraphStyle(
-            'RecText',
-            fontSize=28,
-            fontName='Helvetica-Bold',
-            alignment=TA_CENTER,
-            textColor=rec_border_color
-        ))], [Paragraph(rec_subtitle, ParagraphStyle(
-            'RecSub',
-            fontSize=14,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#555555')
-        ))]]
+        rec_data = [
+            [Paragraph(rec_text, rec_text_style)],
+            [Paragraph(rec_subtitle, styles['RecBoxSub'])]
+        ]
         
         rec_table = Table(rec_data, colWidths=[6*inch])
-        rec_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), rec_bg_color),
-            ('BOX', (0, 0), (-1, -1), 2, rec_border_color),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('TOPPADDING', (0, 0), (-1, -1), 20),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
-        ]))
+        rec_table.setStyle(rec_box_style)
         
         elements.append(rec_table)
         elements.append(Spacer(1, 0.3*inch))
@@ -753,135 +877,230 @@ class ReportExporter:
         
         filepath = self.export_dir / filename
         
-        # Flatten the results for CSV format
+        # Write one (Section, Metric, Value, Details) row per metric
+        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(("Section", "Metric", "Value", "Details"))
+            writer.writerows(
+                (section, metric, display, details)
+                for section, metric, _, display, details in self._metric_rows(results)
+            )
+        
+        return filepath
+    
+    def _metric_rows(self, results: Dict[str, Any]) -> List[Tuple[str, str, Any, Any, str]]:
+        """Flatten results into (section, metric, value, display value, details) rows.
+        
+        `value` is the raw number (or None) for typed exports; `display value`
+        is what the CSV shows.
+        """
         rows = []
         
         # Add summary row
         summary = results.get("summary", {})
-        rows.append({
-            "Section": "Summary",
-            "Metric": "Overall Score",
-            "Value": summary.get("viability_score", "N/A"),
-            "Details": summary.get("recommendation", "")
-        })
+        score = summary.get("viability_score", "N/A")
+        rows.append((
+            "Summary",
+            "Overall Score",
+            score,
+            score,
+            summary.get("recommendation", "")
+        ))
         
         # Add pain research metrics
         if "pain_research" in results:
             pain_data = results["pain_research"]
-            rows.append({
-                "Section": "Pain Research",
-                "Metric": "Pain Score",
-                "Value": pain_data.get("pain_score", "N/A"),
-                "Details": f"Based on {pain_data.get('complaints_analyzed', 0)} complaints"
-            })
-            rows.append({
-                "Section": "Pain Research",
-                "Metric": "Is Urgent Problem",
-                "Value": "Yes" if pain_data.get("is_urgent_problem") else "No",
-                "Details": pain_data.get("analysis_summary", "")
-            })
+            pain_score = pain_data.get("pain_score", "N/A")
+            is_urgent = bool(pain_data.get("is_urgent_problem"))
+            rows.append((
+                "Pain Research",
+                "Pain Score",
+                pain_score,
+                pain_score,
+                f"Based on {pain_data.get('complaints_analyzed', 0)} complaints"
+            ))
+            rows.append((
+                "Pain Research",
+                "Is Urgent Problem",
+                int(is_urgent),
+                "Yes" if is_urgent else "No",
+                pain_data.get("analysis_summary", "")
+            ))
         
         # Add market analysis metrics
         if "market_analysis" in results:
             market_data = results["market_analysis"]
-            rows.append({
-                "Section": "Market Analysis",
-                "Metric": "Average Pricing",
-                "Value": f"${market_data.get('avg_pricing', {}).get('monthly_average', 0)}",
-                "Details": f"Range: ${market_data.get('avg_pricing', {}).get('monthly_low', 0)}-${market_data.get('avg_pricing', {}).get('monthly_high', 0)}"
-            })
-            rows.append({
-                "Section": "Market Analysis",
-                "Metric": "Opportunity Score",
-                "Value": market_data.get("opportunity_score", "N/A"),
-                "Details": market_data.get("insights", "")
-            })
+            avg_pricing = market_data.get('avg_pricing', {})
+            monthly_average = avg_pricing.get('monthly_average', 0)
+            opportunity_score = market_data.get("opportunity_score", "N/A")
+            rows.append((
+                "Market Analysis",
+                "Average Pricing",
+                monthly_average,
+                f"${monthly_average}",
+                f"Range: ${avg_pricing.get('monthly_low', 0)}-${avg_pricing.get('monthly_high', 0)}"
+            ))
+            rows.append((
+                "Market Analysis",
+                "Opportunity Score",
+                opportunity_score,
+                opportunity_score,
+                market_data.get("insights", "")
+            ))
         
         # Add survey metrics
         if "survey_analysis" in results:
             survey_data = results["survey_analysis"]
-            rows.append({
-                "Section": "Survey Analysis",
-                "Metric": "Average WTP",
-                "Value": f"${survey_data.get('avg_wtp', 0)}",
-                "Details": f"{survey_data.get('percent_over_50', 0)}% willing to pay $50+"
-            })
-        
-        # Write to CSV
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ["Section", "Metric", "Value", "Details"]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+            avg_wtp = survey_data.get('avg_wtp', 0)
+            rows.append((
+                "Survey Analysis",
+                "Average WTP",
+                avg_wtp,
+                f"${avg_wtp}",
+                f"{survey_data.get('percent_over_50', 0)}% willing to pay $50+"
+            ))
+        
+        return rows
+    
+    def export_to_parquet(
+        self,
+        results: Dict[str, Any],
+        filename: str = None
+    ) -> Path:
+        """Export the flattened metrics to a Snappy-compressed Parquet file.
+        
+        Same rows as the CSV export, but `value` is a float32 column (null where
+        the metric is not numeric) alongside the CSV's display text.
+        """
+        import pyarrow as pa  # Deferred; only this export needs pyarrow
+        import pyarrow.parquet as pq
+        
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"validation_data_{timestamp}.parquet"
+        
+        filepath = self.export_dir / filename
+        
+        sections, metrics, values, displays, details = zip(*self._metric_rows(results))
+        table = pa.table({
+            "section": pa.array(sections, type=pa.string()),
+            "metric": pa.array(metrics, type=pa.string()),
+            "value": pa.array(
+                [value if isinstance(value, (int, float)) else None for value in values],
+                type=pa.float32()
+            ),
+            "value_text": pa.array([str(display) for display in displays], type=pa.string()),
+            "details": pa.array([str(detail) for detail in details], type=pa.string())
+        })
+        pq.write_table(table, filepath, compression="snappy")
         
         return filepath
     
     def export_to_json(
         self,
         results: Dict[str, Any],
-        filename: str = None
+        filename: str = None,
+        pretty: bool = True
     ) -> Path:
-        """Export results to JSON format."""
+        """Export results to JSON format.
+        
+        With pretty=False the export is compact JSON compressed with gzip
+        (level 1) and written with a ".gz" suffix, for machine consumption.
+        """
+        now = datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"validation_results_{timestamp}.json"
+        if not pretty and not filename.endswith(".gz"):
+            filename = f"{filename}.gz"
         
         filepath = self.export_dir / filename
         
         # Add metadata
-        export_data = {
-            "metadata": {
-                "export_date": datetime.now().isoformat(),
-                "version": "1.0"
-            },
-            "results": results
+        metadata = {
+            "export_date": now.isoformat(),
+            "version": "1.0"
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        # Serialize one results section at a time so peak memory is bounded by
+        # the largest section rather than the whole document. orjson never
+        # emits raw newlines inside strings, so re-indenting nested lines by
+        # replacing b"\n" is safe and yields the same layout as a single dump.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+            opener = open(filepath, 'wb', buffering=1 << 20)
+            outer, inner, colon, end = b'\n  ', b'\n    ', b': ', b'\n}'
+        else:
+            opener = gzip.open(filepath, 'wb', compresslevel=1)
+            outer, inner, colon, end = b'', b'', b':', b'}'
+        
+        def dump(value, indent):
+            data = orjson.dumps(value, option=option)
+            return data.replace(b'\n', indent) if pretty else data
+        
+        with opener as f:
+            f.write(b'{' + outer + b'"metadata"' + colon)
+            f.write(dump(metadata, outer))
+            f.write(b',' + outer + b'"results"' + colon)
+            if not results:
+                f.write(b'{}')
+            else:
+                separator = b'{' + inner
+                for key, value in results.items():
+                    f.write(separator)
+                    f.write(orjson.dumps(str(key)))
+                    f.write(colon)
+                    f.write(dump(value, inner))
+                    separator = b',' + inner
+                f.write(outer + b'}')
+            f.write(end)
         
         return filepath
 
 
-def create_summary_dataframe(results: Dict[str, Any]) -> pd.DataFrame:
+def create_summary_dataframe(results: Dict[str, Any]) -> "pd.DataFrame":
     """Create a pandas DataFrame from validation results for analysis."""
+    import pandas as pd  # Deferred; only this helper needs pandas
+    
+    columns = ["Stage", "Score", "Pass/Fail", "Key Insight"]
     data = []
     
     # Extract key metrics
     if "pain_research" in results:
         pain = results["pain_research"]
-        data.append({
-            "Stage": "Pain Research",
-            "Score": pain.get("pain_score", 0),
-            "Pass/Fail": "Pass" if pain.get("is_urgent_problem") else "Fail",
-            "Key Insight": pain.get("analysis_summary", "")[:100]
-        })
+        data.append((
+            "Pain Research",
+            pain.get("pain_score", 0),
+            "Pass" if pain.get("is_urgent_problem") else "Fail",
+            pain.get("analysis_summary", "")[:100]
+        ))
     
     if "market_analysis" in results:
         market = results["market_analysis"]
-        data.append({
-            "Stage": "Market Analysis", 
-            "Score": market.get("opportunity_score", 0),
-            "Pass/Fail": "Pass" if market.get("opportunity_score", 0) >= 7 else "Fail",
-            "Key Insight": market.get("insights", "")[:100]
-        })
+        data.append((
+            "Market Analysis",
+            market.get("opportunity_score", 0),
+            "Pass" if market.get("opportunity_score", 0) >= 7 else "Fail",
+            market.get("insights", "")[:100]
+        ))
     
     if "content_generation" in results:
-        content = results["content_generation"]
-        data.append({
-            "Stage": "Content Testing",
-            "Score": content.get("predicted_conversion", 0) * 10,  # Convert percentage to score
-            "Pass/Fail": "Pass" if content.get("predicted_conversion", 0) >= 0.02 else "Fail",
-            "Key Insight": f"Predicted {content.get('predicted_conversion', 0)*100:.1f}% conversion"
-        })
+        conversion = results["content_generation"].get("predicted_conversion", 0)
+        data.append((
+            "Content Testing",
+            conversion * 10,  # Convert percentage to score
+            "Pass" if conversion >= 0.02 else "Fail",
+            f"Predicted {conversion*100:.1f}% conversion"
+        ))
     
     if "survey_analysis" in results:
-        survey = results["survey_analysis"]
-        data.append({
-            "Stage": "Survey Analysis",
-            "Score": min(survey.get("avg_wtp", 0) / 10, 10),  # Convert WTP to score
-            "Pass/Fail": "Pass" if survey.get("avg_wtp", 0) >= 50 else "Fail",
-            "Key Insight": f"Avg WTP: ${survey.get('avg_wtp', 0)}"
-        })
+        avg_wtp = results["survey_analysis"].get("avg_wtp", 0)
+        data.append((
+            "Survey Analysis",
+            min(avg_wtp / 10, 10),  # Convert WTP to score
+            "Pass" if avg_wtp >= 50 else "Fail",
+            f"Avg WTP: ${avg_wtp}"
+        ))
     
-    return pd.DataFrame(data)
\ No newline at end of file
+    return pd.DataFrame.from_records(data, columns=columns)
\ No newline at end of file
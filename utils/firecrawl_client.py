@@ -1,24 +1,201 @@
 """Firecrawl API client wrapper for web scraping."""
+import atexit
+import heapq
+import logging
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Union
-from tenacity import retry, stop_after_attempt, wait_exponential
-import json
-from urllib.parse import urlparse
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
+import orjson
+from urllib.parse import urlparse, urlunparse
 import re
+from cachetools import LRUCache
 
 from config.settings import (
     FIRECRAWL_API_KEY,
     FIRECRAWL_BASE_URL,
+    FIRECRAWL_BATCH_POLL_INTERVAL,
     FIRECRAWL_BATCH_SIZE,
+    FIRECRAWL_BATCH_TIMEOUT,
     FIRECRAWL_MAX_URLS,
     FIRECRAWL_PAIN_RESEARCH_MAX_URLS,
     FIRECRAWL_MARKET_ANALYSIS_MAX_URLS,
+    FIRECRAWL_MAX_CONCURRENCY,
+    FIRECRAWL_MAX_RESPONSE_BYTES,
+    FIRECRAWL_REQUESTS_PER_SECOND,
     MAX_RETRIES,
     RETRY_DELAY,
     REQUEST_TIMEOUT
 )
 
+logger = logging.getLogger(__name__)
+
+_MULTI_BLANK_LINES = re.compile(r'\n\s*\n\s*\n')
+_HORIZONTAL_SPACE = re.compile(r'[ \t]+')
+# Common boilerplate lines that add noise to analysis prompts
+_BOILERPLATE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'Cookie Policy.*?(?=\n|$)',
+        r'Privacy Policy.*?(?=\n|$)',
+        r'Terms of Service.*?(?=\n|$)',
+        r'Subscribe to.*?(?=\n|$)',
+        r'Sign up for.*?(?=\n|$)',
+        r'Follow us on.*?(?=\n|$)',
+        r'\[Advertisement\].*?(?=\n|$)',
+        r'Share this:.*?(?=\n|$)'
+    )
+)
+
+
+# Shared by every client so fallback scrapes reuse warm worker threads
+_SCRAPE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=FIRECRAWL_MAX_CONCURRENCY,
+    thread_name_prefix="firecrawl-scrape"
+)
+atexit.register(_SCRAPE_EXECUTOR.shutdown)
+
+
+def _alternation(*fragments: str) -> re.Pattern:
+    """Compile literal fragments into one pattern that matches any of them."""
+    return re.compile("|".join(map(re.escape, fragments)))
+
+
+# High-value domains for complaints/discussions
+_HIGH_VALUE_DOMAINS = frozenset({
+    'reddit.com', 'stackoverflow.com', 'quora.com',
+    'hackernews.com', 'producthunt.com', 'indiehackers.com',
+    'medium.com', 'substack.com'
+})
+# Forum-like paths
+_DISCUSSION_PATH_RE = _alternation(
+    '/comments/', '/discussion/', '/forum/', '/thread/',
+    '/post/', '/question/', '/review/', '/feedback/'
+)
+# Low-value content
+_SKIP_URL_RE = _alternation(
+    'ads.', 'sponsored', 'affiliate', 'utm_',
+    '/api/', '/admin/', '/login/', '/signup/',
+    '.pdf', '.doc', '.xls', 'javascript:'
+)
+# URL scoring for _score_url: points by registered domain, then by the
+# first matching content type tier
+_SOURCE_SCORES = {
+    'reddit.com': 10,
+    'stackoverflow.com': 8,
+    'quora.com': 8,
+    'medium.com': 6,
+    'substack.com': 6
+}
+_CONTENT_TYPE_SCORES = (
+    (_alternation('/comments/', '/post/', '/thread/'), 5),
+    (_alternation('/review/', '/feedback/'), 4)
+)
+# Recency indicators (rough heuristic)
+_RECENT_YEAR_RE = _alternation('2024', '2023')
+
+
+def _root_domain(host: str) -> str:
+    """Last two labels of a host name, e.g. 'old.reddit.com' -> 'reddit.com'."""
+    return ".".join(host.rsplit(".", 2)[-2:])
+
+
+def _canonicalize_url(url: str) -> str:
+    """Normalize a URL so trivially different links to one page compare equal."""
+    try:
+        parsed = urlparse(url.strip())
+    except ValueError:
+        # Malformed (e.g. an unclosed IPv6 host); keep it as its own key
+        return url
+    return urlunparse((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        parsed.path.rstrip("/"),
+        parsed.params,
+        parsed.query,
+        ""
+    ))
+
+
+@lru_cache(maxsize=4096)
+def _is_scrapeable_url_cached(url: str) -> bool:
+    """Check if URL is worth scraping based on domain and path."""
+    try:
+        parsed = urlparse(url)
+        domain = parsed.hostname or ""
+        path = parsed.path.lower()
+        
+        # Skip if contains skip indicators
+        if _SKIP_URL_RE.search(url.lower()):
+            return False
+        
+        # Include if high-value domain or discussion indicator
+        if _root_domain(domain) in _HIGH_VALUE_DOMAINS:
+            return True
+        
+        if _DISCUSSION_PATH_RE.search(path):
+            return True
+        
+        # Include other domains but with lower priority
+        return True
+        
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=4096)
+def _score_url(url: str) -> int:
+    """Scraping priority of a URL; higher is more valuable."""
+    score = 0
+    url_lower = url.lower()
+    
+    # High priority sources
+    try:
+        host = urlparse(url_lower).hostname or ""
+    except ValueError:
+        host = ""
+    score += _SOURCE_SCORES.get(_root_domain(host), 0)
+    
+    # Content type indicators
+    for pattern, points in _CONTENT_TYPE_SCORES:
+        if pattern.search(url_lower):
+            score += points
+            break
+    
+    if _RECENT_YEAR_RE.search(url_lower):
+        score += 2
+    
+    return score
+
+
+class ResponseTooLargeError(Exception):
+    """Raised when a Firecrawl response exceeds the configured size cap."""
+
+
+class _RateLimiter:
+    """Spaces out calls so at most `rate` start per second across threads."""
+    
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """Block until the caller's slot comes up."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
 
 class FirecrawlClient:
     """Wrapper for Firecrawl API with batch scraping functionality."""
@@ -34,108 +211,79 @@ class FirecrawlClient:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        self._rate_limiter = _RateLimiter(FIRECRAWL_REQUESTS_PER_SECOND)
+        # Successful scrapes by canonical URL, so repeat runs skip the API
+        self._scrape_cache = LRUCache(maxsize=256)
+        
+        # Keep-alive session so concurrent scrapes reuse pooled connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(FIRECRAWL_MAX_CONCURRENCY, 10))
+        self.session.mount("https://", adapter)
     
     def _is_scrapeable_url(self, url: str) -> bool:
         """Check if URL is worth scraping based on domain and path."""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            path = parsed.path.lower()
-            
-            # High-value domains for complaints/discussions
-            high_value_domains = [
-                'reddit.com', 'stackoverflow.com', 'quora.com',
-                'hackernews.com', 'producthunt.com', 'indiehackers.com',
-                'medium.com', 'substack.com'
-            ]
-            
-            # Forum-like paths
-            discussion_indicators = [
-                '/comments/', '/discussion/', '/forum/', '/thread/',
-                '/post/', '/question/', '/review/', '/feedback/'
-            ]
-            
-            # Skip low-value content
-            skip_indicators = [
-                'ads.', 'sponsored', 'affiliate', 'utm_',
-                '/api/', '/admin/', '/login/', '/signup/',
-                '.pdf', '.doc', '.xls', 'javascript:'
-            ]
-            
-            # Skip if contains skip indicators
-            if any(indicator in url.lower() for indicator in skip_indicators):
-                return False
-            
-            # Include if high-value domain or discussion indicator
-            if any(domain.endswith(hvd) for hvd in high_value_domains):
-                return True
-            
-            if any(indicator in path for indicator in discussion_indicators):
-                return True
-            
-            # Include other domains but with lower priority
-            return True
-            
-        except Exception:
-            return False
-    
-    def _prioritize_urls(self, urls: List[str]) -> List[str]:
-        """Prioritize URLs for scraping based on value."""
-        scored_urls = []
-        
-        for url in urls:
-            score = 0
-            url_lower = url.lower()
-            
-            # High priority sources
-            if 'reddit.com' in url_lower:
-                score += 10
-            elif any(domain in url_lower for domain in ['stackoverflow.com', 'quora.com']):
-                score += 8
-            elif any(domain in url_lower for domain in ['medium.com', 'substack.com']):
-                score += 6
-            
-            # Content type indicators
-            if any(indicator in url_lower for indicator in ['/comments/', '/post/', '/thread/']):
-                score += 5
-            elif any(indicator in url_lower for indicator in ['/review/', '/feedback/']):
-                score += 4
-            
-            # Recency indicators (rough heuristic)
-            if any(year in url_lower for year in ['2024', '2023']):
-                score += 2
-            
-            scored_urls.append((score, url))
-        
-        # Sort by score (descending) and return URLs
-        scored_urls.sort(key=lambda x: x[0], reverse=True)
-        return [url for score, url in scored_urls]
+        return _is_scrapeable_url_cached(url)
     
     @retry(
         stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(multiplier=RETRY_DELAY, min=2, max=30)
+        wait=wait_exponential(multiplier=RETRY_DELAY, min=2, max=30),
+        retry=retry_if_not_exception_type(ResponseTooLargeError)
     )
-    def _make_request(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Make API request with retry logic."""
+    def _make_request(
+        self,
+        endpoint: str,
+        payload: Optional[Dict[str, Any]] = None,
+        method: str = "POST",
+        max_bytes: int = FIRECRAWL_MAX_RESPONSE_BYTES
+    ) -> Dict[str, Any]:
+        """Make API request with retry logic.
+        
+        Responses larger than `max_bytes` are not retried.
+        """
+        return self._send_request(endpoint, payload, method, max_bytes)
+    
+    def _send_request(
+        self,
+        endpoint: str,
+        payload: Optional[Dict[str, Any]] = None,
+        method: str = "POST",
+        max_bytes: int = FIRECRAWL_MAX_RESPONSE_BYTES
+    ) -> Dict[str, Any]:
+        """Make a single API request, without retries.
+        
+        The body is streamed and abandoned once it passes `max_bytes`, so a
+        runaway page cannot stall the pipeline. Used directly for calls that
+        must not be repeated, such as creating a billed batch job.
+        """
         url = f"{self.base_url}/{endpoint}"
+        self._rate_limiter.wait()
         
         try:
-            response = requests.post(
+            with self.session.request(
+                method,
                 url,
-                headers=self.headers,
                 json=payload,
-                timeout=REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+                timeout=REQUEST_TIMEOUT,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    body += chunk
+                    if len(body) > max_bytes:
+                        raise ResponseTooLargeError(
+                            f"Firecrawl response exceeded {max_bytes} bytes"
+                        )
+            return orjson.loads(body)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             raise Exception(f"Firecrawl API request failed: {str(e)}")
     
     def scrape_single_url(self, url: str) -> Dict[str, Any]:
         """Scrape a single URL."""
         payload = {
             "url": url,
-            "formats": ["markdown", "html"],
+            "formats": ["markdown"],
             "includeTags": ["p", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "li"],
             "excludeTags": ["nav", "footer", "header", "aside", "script", "style"],
             "onlyMainContent": True,
@@ -176,94 +324,169 @@ class FirecrawlClient:
         progress_callback: Optional[callable] = None,
         max_urls: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Scrape multiple URLs using batch API or sequential scraping."""
+        """Scrape multiple URLs via the batch API, falling back to single-URL scrapes."""
         if not urls:
             return []
         
+        # Drop duplicates that differ only by fragment, case or trailing slash
+        unique_urls = {}
+        for url in urls:
+            unique_urls.setdefault(_canonicalize_url(url), url)
+        
         # Filter and prioritize URLs
-        scrapeable_urls = [url for url in urls if self._is_scrapeable_url(url)]
-        prioritized_urls = self._prioritize_urls(scrapeable_urls)
+        scrapeable_urls = [url for url in unique_urls.values() if self._is_scrapeable_url(url)]
         
-        # Limit to max URLs (use provided limit or default)
+        # Keep only the top-scored max URLs (use provided limit or default);
+        # nlargest avoids sorting every candidate and breaks ties by input order
         effective_max_urls = max_urls if max_urls is not None else FIRECRAWL_MAX_URLS
-        urls_to_scrape = prioritized_urls[:effective_max_urls]
+        urls_to_scrape = heapq.nlargest(effective_max_urls, scrapeable_urls, key=_score_url)
         
-        print(f"DEBUG: Filtering {len(urls)} URLs -> {len(scrapeable_urls)} scrapeable -> {len(urls_to_scrape)} to scrape")
+        logger.debug(
+            "Filtering %d URLs -> %d scrapeable -> %d to scrape",
+            len(urls), len(scrapeable_urls), len(urls_to_scrape)
+        )
         
         results = []
+        pending_urls = []
+        for url in urls_to_scrape:
+            cached = self._scrape_cache.get(_canonicalize_url(url))
+            if cached is not None:
+                results.append(cached)
+            else:
+                pending_urls.append(url)
         
         # Process in batches
-        for i in range(0, len(urls_to_scrape), FIRECRAWL_BATCH_SIZE):
-            batch = urls_to_scrape[i:i + FIRECRAWL_BATCH_SIZE]
+        for i in range(0, len(pending_urls), FIRECRAWL_BATCH_SIZE):
+            batch = pending_urls[i:i + FIRECRAWL_BATCH_SIZE]
             
             if progress_callback:
                 progress_callback(f"Scraping batch {i//FIRECRAWL_BATCH_SIZE + 1} ({len(batch)} URLs)...")
             
-            # Use individual scraping for better reliability
-            for url in batch:
-                if progress_callback:
-                    progress_callback(f"Scraping {url[:50]}...")
-                result = self.scrape_single_url(url)
-                results.append(result)
-                time.sleep(0.5)  # Rate limiting between requests
+            # One batch job per batch; URLs it could not return are retried singly
+            try:
+                batch_results = self._batch_scrape_internal(batch)
+            except Exception as e:
+                logger.warning("Batch scrape failed, falling back to single URLs: %s", e)
+                batch_results = [self._failed_result(url, str(e)) for url in batch]
+            
+            missing = [r["url"] for r in batch_results if r.get("retry")]
+            if missing:
+                retried = self._scrape_urls_concurrently(missing, progress_callback)
+                batch_results = [retried.get(r["url"], r) if r.get("retry") else r for r in batch_results]
+            
+            for result in batch_results:
+                result.pop("retry", None)
+                if result["success"]:
+                    self._scrape_cache[_canonicalize_url(result["url"])] = result
+            results.extend(batch_results)
         
         successful_results = [r for r in results if r["success"] and r["content"]]
-        print(f"DEBUG: Successfully scraped {len(successful_results)}/{len(urls_to_scrape)} URLs")
+        logger.debug("Successfully scraped %d/%d URLs", len(successful_results), len(urls_to_scrape))
         
         return results
     
+    def _scrape_urls_concurrently(
+        self,
+        urls: List[str],
+        progress_callback: Optional[callable] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Scrape URLs one request each, in parallel; _make_request paces the calls."""
+        results = {}
+        futures = {_SCRAPE_EXECUTOR.submit(self.scrape_single_url, url): url for url in urls}
+        for future in as_completed(futures):
+            url = futures[future]
+            results[url] = future.result()
+            if progress_callback:
+                progress_callback(f"Scraped {url[:50]}...")
+        return results
+    
+    @staticmethod
+    def _failed_result(url: str, error: str, retry: bool = True) -> Dict[str, Any]:
+        """Result entry for a URL the batch job did not scrape."""
+        return {
+            "url": url,
+            "success": False,
+            "content": "",
+            "title": "",
+            "error": error,
+            "retry": retry
+        }
+    
     def _batch_scrape_internal(self, urls: List[str]) -> List[Dict[str, Any]]:
         """Internal method for batch scraping."""
-        # Firecrawl API v1 batch endpoint format
+        # Firecrawl API v1 batch endpoint: start a job, then poll for its documents
         payload = {
             "urls": urls,
-            "extractorOptions": {
-                "formats": ["markdown"],
-                "includeTags": ["p", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "li"],
-                "excludeTags": ["nav", "footer", "header", "aside", "script", "style"],
-                "onlyMainContent": True
-            },
+            "formats": ["markdown"],
+            "includeTags": ["p", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "li"],
+            "excludeTags": ["nav", "footer", "header", "aside", "script", "style"],
+            "onlyMainContent": True,
             "timeout": 30000,
             "waitFor": 3000
         }
         
-        response = self._make_request("batch/scrape", payload)
+        # Not retried: a timeout after the job was accepted would start a
+        # second billed job for the same URLs
+        job = self._send_request("batch/scrape", payload)
+        job_id = job.get("id")
+        if not job_id:
+            raise Exception(job.get("error", "Batch scrape job was not created"))
+        
+        documents = []
+        endpoint = f"batch/scrape/{job_id}"
+        max_bytes = FIRECRAWL_MAX_RESPONSE_BYTES * len(urls)
+        deadline = time.monotonic() + FIRECRAWL_BATCH_TIMEOUT
+        while True:
+            status = self._make_request(endpoint, method="GET", max_bytes=max_bytes)
+            if status.get("status") == "completed":
+                break
+            if status.get("status") == "failed" or time.monotonic() >= deadline:
+                if status.get("status") != "failed":
+                    # Stop the job so the URLs re-scraped singly are not paid twice
+                    try:
+                        self._send_request(endpoint, method="DELETE")
+                    except Exception as e:
+                        logger.warning("Could not cancel batch scrape %s: %s", job_id, e)
+                # Keep whatever finished; the rest falls back to single scrapes
+                documents.extend(status.get("data") or [])
+                status = {}
+                break
+            time.sleep(FIRECRAWL_BATCH_POLL_INTERVAL)
+        
+        # Completed jobs may page their documents
+        while status:
+            documents.extend(status.get("data") or [])
+            next_url = status.get("next")
+            if not next_url or not next_url.startswith(self.base_url):
+                break
+            status = self._make_request(
+                next_url[len(self.base_url) + 1:], method="GET", max_bytes=max_bytes
+            )
+        
+        documents_by_url = {}
+        for document in documents:
+            source_url = document.get("metadata", {}).get("sourceURL", "")
+            documents_by_url[source_url.rstrip("/")] = document
         
-        # Handle batch response format
         results = []
-        batch_data = response.get("data", [])
-        
-        for i, url in enumerate(urls):
-            if i < len(batch_data):
-                item = batch_data[i]
-                if item.get("success", False):
-                    content = item.get("data", {})
-                    markdown_content = content.get("markdown", "")
-                    cleaned_content = self._clean_content(markdown_content)
-                    
-                    results.append({
-                        "url": url,
-                        "success": True,
-                        "content": cleaned_content,
-                        "title": content.get("metadata", {}).get("title", ""),
-                        "error": None
-                    })
-                else:
-                    results.append({
-                        "url": url,
-                        "success": False,
-                        "content": "",
-                        "title": "",
-                        "error": item.get("error", "Unknown error")
-                    })
-            else:
-                results.append({
-                    "url": url,
-                    "success": False,
-                    "content": "",
-                    "title": "",
-                    "error": "No data returned"
-                })
+        for url in urls:
+            document = documents_by_url.get(url.rstrip("/"))
+            if document is None:
+                results.append(self._failed_result(url, "No data returned"))
+                continue
+            
+            metadata = document.get("metadata", {})
+            if metadata.get("error"):
+                results.append(self._failed_result(url, metadata["error"], retry=False))
+                continue
+            
+            results.append({
+                "url": url,
+                "success": True,
+                "content": self._clean_content(document.get("markdown", "")),
+                "title": metadata.get("title", ""),
+                "error": None
+            })
         
         return results
     
@@ -272,28 +495,24 @@ class FirecrawlClient:
         if not content:
             return ""
         
+        max_length = 8000  # Reasonable limit for API calls
+        
+        # Only the first part is kept, so cut very long pages before the regex
+        # passes; twice the limit leaves room for the whitespace they remove
+        truncated = len(content) > 2 * max_length
+        if truncated:
+            content = content[:2 * max_length]
+        
         # Remove excessive whitespace
-        content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
-        content = re.sub(r'[ \t]+', ' ', content)
+        content = _MULTI_BLANK_LINES.sub('\n\n', content)
+        content = _HORIZONTAL_SPACE.sub(' ', content)
         
         # Remove common unwanted patterns
-        patterns_to_remove = [
-            r'Cookie Policy.*?(?=\n|$)',
-            r'Privacy Policy.*?(?=\n|$)',
-            r'Terms of Service.*?(?=\n|$)',
-            r'Subscribe to.*?(?=\n|$)',
-            r'Sign up for.*?(?=\n|$)',
-            r'Follow us on.*?(?=\n|$)',
-            r'\[Advertisement\].*?(?=\n|$)',
-            r'Share this:.*?(?=\n|$)'
-        ]
-        
-        for pattern in patterns_to_remove:
-            content = re.sub(pattern, '', content, flags=re.IGNORECASE)
+        for pattern in _BOILERPLATE_PATTERNS:
+            content = pattern.sub('', content)
         
         # Truncate if too long (keep first part which usually has the main content)
-        max_length = 8000  # Reasonable limit for API calls
-        if len(content) > max_length:
+        if truncated or len(content) > max_length:
             content = content[:max_length] + "...[content truncated]"
         
         return content.strip()
@@ -302,7 +521,8 @@ class FirecrawlClient:
         self, 
         search_results: List[Dict[str, Any]], 
         progress_callback: Optional[callable] = None,
-        module_type: str = "general"
+        module_type: str = "general",
+        inplace: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Enhanced method to get scraped content optimized for analysis.
@@ -310,6 +530,8 @@ class FirecrawlClient:
         Args:
             search_results: List of search results with 'link' field
             progress_callback: Optional callback for progress updates
+            inplace: Add the scraped fields to the given dicts instead of copies;
+                only for callers that own the search results
             
         Returns:
             List of enhanced search results with scraped content
@@ -332,16 +554,16 @@ class FirecrawlClient:
         
         scraped_results = self.batch_scrape_urls(urls, progress_callback, max_urls)
         
-        # Create a mapping of URL to scraped content
-        scraped_map = {result["url"]: result for result in scraped_results}
+        # Create a mapping of canonical URL to scraped content
+        scraped_map = {_canonicalize_url(result["url"]): result for result in scraped_results}
         
         # Enhance original search results with scraped content
         enhanced_results = []
         for result in search_results:
             url = result.get("link", "")
-            scraped = scraped_map.get(url, {})
+            scraped = scraped_map.get(_canonicalize_url(url), {}) if url else {}
             
-            enhanced_result = result.copy()
+            enhanced_result = result if inplace else result.copy()
             
             if scraped.get("success") and scraped.get("content"):
                 # Replace snippet with full content for analysis
@@ -1,14 +1,34 @@
 """Serper.dev API client wrapper for web searches."""
+import atexit
+import hashlib
+import logging
+import threading
 import requests
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timedelta
 import time
-import json
-from tenacity import retry, stop_after_attempt, wait_exponential
+import re
+from urllib.parse import urlparse
+import orjson
+from cachetools import TTLCache
+from diskcache import Cache
 
 from config.settings import (
+    CACHE_DIR,
+    DISK_CACHE_SIZE_LIMIT,
+    ENABLE_CACHE,
+    ENABLE_DISK_CACHE,
     SERPER_API_KEY,
     SERPER_BASE_URL,
+    SERPER_CACHE_MAX_SIZE,
+    SERPER_CACHE_TTL,
+    SERPER_BATCH_SIZE,
+    SERPER_MAX_CONCURRENCY,
     SERPER_SEARCH_LIMIT,
     SERPER_TIME_RANGE,
     MAX_RETRIES,
@@ -16,6 +36,280 @@ from config.settings import (
     REQUEST_TIMEOUT
 )
 
+logger = logging.getLogger(__name__)
+
+# Shared worker pool for search fan-out; the workload is network-bound
+_SEARCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=SERPER_MAX_CONCURRENCY,
+    thread_name_prefix="serper-search"
+)
+atexit.register(_SEARCH_EXECUTOR.shutdown)
+
+# Fail fast on connect; allow the configured budget for slow reads
+_TIMEOUT = (5, REQUEST_TIMEOUT)
+
+# Responses shared by every client in the process; clients are created per run
+_RESPONSE_CACHE = TTLCache(maxsize=SERPER_CACHE_MAX_SIZE, ttl=SERPER_CACHE_TTL)
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def _alternation(*fragments: str) -> re.Pattern:
+    """Compile literal fragments into one pattern that matches any of them."""
+    return re.compile("|".join(map(re.escape, fragments)))
+
+
+# Sites that host discussion or listings rather than competing products
+_RESULT_EXCLUDE_DOMAINS = frozenset({"wikipedia.org", "reddit.com", "quora.com", "youtube.com"})
+_COMPETITOR_EXCLUDE_DOMAINS = _RESULT_EXCLUDE_DOMAINS | {
+    "facebook.com", "twitter.com", "linkedin.com", "instagram.com",
+    "amazon.com", "ebay.com", "indeed.com", "glassdoor.com"
+}
+# Indicators of a product/service page
+_PRODUCT_INDICATOR_RE = _alternation(
+    "pricing", "features", "sign up", "free trial",
+    "per month", "subscription", "get started"
+)
+# Obvious non-competitors, matched against the title only
+_NON_COMPETITOR_TITLE_RE = _alternation(
+    "how to", "what is", "tutorial", "guide",
+    "wikipedia", "definition", "meaning"
+)
+# ANY business/product indicator
+_BUSINESS_INDICATOR_RE = _alternation(
+    "software", "platform", "solution", "service", "app",
+    "tool", "system", "product", "company", "inc", "ltd",
+    "corp", ".com", ".io", "pricing", "features", "customers",
+    "clients", "users", "enterprise", "business", "professional",
+    "team", "startup", "saas", "cloud", "online", "digital",
+    "free", "trial", "demo", "sign up", "login", "dashboard",
+    "api", "integration", "automate", "manage"
+)
+_BUSINESS_TLD_RE = _alternation(".com", ".io", ".co", ".app", ".ai", ".dev", ".tech")
+_PRICING_KEYWORD_RE = _alternation(
+    "$", "per month", "monthly", "pricing", "cost",
+    "subscription", "free trial", "price"
+)
+_MARKET_KEYWORD_RE = _alternation(
+    "billion", "million", "market size", "market worth",
+    "industry report", "statistics", "growth rate", "cagr"
+)
+
+
+# Known platforms as (label, regex); compiled into one alternation so a URL is
+# classified in a single scan
+_PLATFORM_SOURCES = (
+    # Social platforms
+    ("Reddit", r"reddit\.com"),
+    ("Quora", r"quora\.com"),
+    ("Twitter/X", r"twitter\.com|x\.com"),
+    ("Facebook", r"facebook\.com"),
+    ("LinkedIn", r"linkedin\.com"),
+    # Developer/Tech platforms
+    ("Stack Overflow", r"stackoverflow\.com|stackexchange\.com"),
+    ("GitHub", r"github\.com"),
+    ("Hacker News", r"ycombinator\.com"),
+    ("Product Hunt", r"producthunt\.com"),
+    ("Indie Hackers", r"indiehackers\.com"),
+    # Review platforms
+    ("Trustpilot", r"trustpilot\.com"),
+    ("G2", r"g2\.com"),
+    ("Capterra", r"capterra\.com"),
+    ("Glassdoor", r"glassdoor\.com"),
+    ("Yelp", r"yelp\.com"),
+    ("Amazon Reviews", r"amazon\.com.*/review"),
+    # Content platforms
+    ("Medium", r"medium\.com"),
+    ("YouTube", r"youtube\.com"),
+    ("Blog", r"wordpress\.com|blogspot\.com")
+)
+_PLATFORM_SOURCE_RE = re.compile("|".join(
+    f"(?P<source{i}>{pattern})" for i, (_, pattern) in enumerate(_PLATFORM_SOURCES)
+))
+_PLATFORM_SOURCE_LABELS = {
+    f"source{i}": label for i, (label, _) in enumerate(_PLATFORM_SOURCES)
+}
+# Review sites by domain, for labelling review results
+_REVIEW_PLATFORMS = {
+    "g2.com": "G2",
+    "capterra.com": "Capterra",
+    "trustpilot.com": "Trustpilot",
+    "getapp.com": "GetApp",
+    "softwareadvice.com": "Software Advice"
+}
+_REVIEW_PLATFORM_RE = _alternation(*_REVIEW_PLATFORMS)
+_GENERIC_SOURCES = (
+    ("forum", "Forum"),
+    ("review", "Review Site"),
+    ("support", "Support Forum"),
+    ("community", "Community")
+)
+
+# Fallback complaint queries when AI generation is off; "{t}" is the search term
+_COMPLAINT_QUERY_TEMPLATES = (
+    # Reddit searches - simple
+    "{t} frustrated reddit",
+    "{t} annoying reddit",
+    "{t} problem reddit",
+    "{t} issue reddit",
+    "{t} help reddit",
+    # Forums - simple
+    "{t} problem quora",
+    "{t} frustrating forum",
+    "{t} issue discussion",
+    "{t} difficult forum",
+    # Review and feedback
+    "{t} review negative",
+    "{t} cons downsides",
+    "{t} complaints",
+    "{t} disappointed",
+    # Alternative searches
+    "{t} alternative",
+    "{t} better than",
+    "switching from {t}",
+    # General searches
+    "{t} waste time",
+    "{t} waste money",
+    "{t} biggest problem",
+    "{t} main issue",
+    "{t} worst thing",
+    "{t} doesn't work",
+    "{t} not working",
+    "{t} broken",
+    "{t} difficult use"
+)
+# Simple, broad queries for marketers describing a creative-tool idea
+_MARKETER_QUERIES = (
+    "marketing creatives difficult",
+    "ad creative frustrating reddit",
+    "creating marketing visuals problem",
+    "design marketing materials time",
+    "marketing design without designer",
+    "canva adobe marketing complicated",
+    "marketer need designer",
+    "marketing creative process slow",
+    "marketing creative assets help",
+    "marketing team design bottleneck",
+    "social media graphics overwhelmed",
+    "ad creatives running out ideas",
+    "marketing design tools problems",
+    "ai design tools marketing",
+    "creative automation marketing"
+)
+# Simple emotion/problem words combined with each Reddit base term
+_REDDIT_KEYWORDS = (
+    "frustrated", "annoying", "problem", "issue", "difficult",
+    "help", "advice", "struggle", "hate", "sucks", "terrible",
+    "waste time", "waste money", "alternative", "better",
+    "broken", "not working", "complicated", "expensive",
+    "slow", "buggy", "anyone else", "how to", "why",
+    "recommendations", "solution", "fix", "workaround"
+)
+# Reddit base terms for marketers describing a creative-tool idea
+_MARKETER_BASE_TERMS = ("marketing creative", "ad design", "social media graphics", "marketing visuals")
+# Reddit-focused queries; "{t}" is a base term
+_REDDIT_SITE_QUERY_TEMPLATES = (
+    "site:reddit.com {t} problem",
+    "site:reddit.com {t} help",
+    "site:reddit.com {t} frustrated",
+    "site:reddit.com {t} alternative",
+    "site:reddit.com {t} sucks",
+    "site:reddit.com/r/entrepreneur {t}",
+    "site:reddit.com/r/marketing {t}",
+    "site:reddit.com/r/smallbusiness {t}"
+)
+_REDDIT_VARIATION_QUERY_TEMPLATES = (
+    "{t} drives me crazy reddit",
+    "{t} recommendations reddit",
+    "{t} better than reddit",
+    "{t} review reddit",
+    "{t} opinion reddit",
+    "{t} experience reddit",
+    "why {t} difficult reddit",
+    "anyone use {t} reddit",
+    "alternative to {t} reddit",
+    "{t} worth it reddit"
+)
+# Default product words for the keyword fallback in search_competitors
+_DEFAULT_SOLUTION_KEYWORDS = ("software", "tool", "platform", "service", "app", "solution", "system")
+# Broad competitor queries; "{t}" is the extracted search base
+_COMPETITOR_QUERY_TEMPLATES = (
+    "{t} software",
+    "{t} tools",
+    "{t} platform",
+    "{t} app",
+    "{t} solution",
+    "{t} pricing",
+    "{t} companies",
+    "best {t}",
+    "{t} alternatives",
+    "{t} competitors",
+    "{t} providers",
+    "{t} services"
+)
+_PROBLEM_COMPETITOR_QUERY_TEMPLATES = (
+    "{t} software",
+    "{t} solution",
+    "{t} alternatives"
+)
+# "I want to make/build/create X" style descriptions; group 1 is the core concept
+_SOLUTION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"i want to (?:make|build|create|develop) (?:a |an )?(.+)",
+    r"(?:web app|app|platform|tool|software|system) for (.+) (?:that|which)",
+    r"solution for (.+)",
+    r"help (?:with |for )?(.+)"
+))
+# Filler words dropped when shortening a long search base
+_SKIP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "with", "for", "to", "that", "which", "gives", "provides"
+})
+# Separators between a product name and the rest of a page title
+_TITLE_SEPARATOR_RE = _alternation(" - ", " | ", " — ", ":")
+# Ratings like "4.5/5", "4.5 out of 5" or "4.5 stars"
+_RATING_RE = re.compile(r'(\d+\.?\d*)\s*(?:/5\b|out of 5\b|stars?\b)')
+
+
+def _matches_domain(url: str, domains: frozenset) -> Optional[str]:
+    """Return the entry of `domains` that the URL's host is, or is under."""
+    try:
+        host = (urlparse(url).hostname or "").lower()
+    except ValueError:
+        return None
+    labels = host.split(".")
+    for i in range(len(labels) - 1):
+        candidate = ".".join(labels[i:])
+        if candidate in domains:
+            return candidate
+    return None
+
+
+# The only fields read from organic results; everything else is dropped
+_ORGANIC_FIELDS = ("title", "snippet", "link", "date")
+
+
+def _slim_search_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep just the organic results' used fields from a /search response."""
+    if "organic" not in response:
+        return {}
+    return {"organic": [
+        {field: item[field] for field in _ORGANIC_FIELDS if field in item}
+        for item in response["organic"]
+    ]}
+
+
+def _result_text(result: Dict[str, Any]) -> str:
+    """Lowercased title and snippet of a search result, for keyword checks."""
+    return f"{result.get('title', '')} {result.get('snippet', '')}".lower()
+
+
+def _dedupe_queries(queries: List[str]) -> List[str]:
+    """Drop repeated queries, ignoring case and extra whitespace; keeps order."""
+    unique = {}
+    for query in queries:
+        query = " ".join(str(query).split())
+        if query:
+            unique.setdefault(query.lower(), query)
+    return list(unique.values())
+
 
 class SerperClient:
     """Wrapper for Serper.dev API with search functionality."""
@@ -31,6 +325,31 @@ class SerperClient:
             "X-API-KEY": self.api_key,
             "Content-Type": "application/json"
         }
+        # Keep-alive session so concurrent searches reuse pooled connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Retries happen inside the pool: transient 429/5xx responses and
+        # connection errors back off exponentially and honour Retry-After
+        retries = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_DELAY,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(SERPER_MAX_CONCURRENCY, 10),
+            max_retries=retries
+        )
+        self.session.mount("https://", adapter)
+        # Persistent cache shared across Streamlit restarts
+        self._disk_cache = (
+            Cache(str(CACHE_DIR / "serper_cache"), size_limit=DISK_CACHE_SIZE_LIMIT)
+            if ENABLE_CACHE and ENABLE_DISK_CACHE else None
+        )
+        # Cleared if the API answers a bulk /search with anything but a list
+        self._batch_supported = True
     
     def _get_time_filter(self) -> str:
         """Get time filter for searches based on configured range."""
@@ -43,25 +362,151 @@ class SerperClient:
         else:
             return "qdr:m6"  # Default to 6 months
     
-    @retry(
-        stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(multiplier=RETRY_DELAY, min=2, max=30)
-    )
-    def _make_request(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Make API request with retry logic."""
+    def _make_request(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """Make API request, reusing a recent identical response when cached."""
+        if not ENABLE_CACHE:
+            return self._post(endpoint, payload)
+        
+        cache_key = self._cache_key(endpoint, payload)
+        if not force_refresh:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+        
+        result = self._post(endpoint, payload)
+        self._store_cached(cache_key, result)
+        return result
+    
+    def _cache_key(self, endpoint: str, payload: Dict[str, Any]) -> str:
+        """Stable key for one request's cached response."""
+        return hashlib.blake2b(
+            orjson.dumps([endpoint, payload], option=orjson.OPT_SORT_KEYS),
+            digest_size=16
+        ).hexdigest()
+    
+    def _get_cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a response in the process cache, then on disk."""
+        with _RESPONSE_CACHE_LOCK:
+            cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is None and self._disk_cache is not None:
+            cached = self._disk_cache.get(cache_key)
+        return cached
+    
+    def _store_cached(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Remember a response in the process cache and on disk."""
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[cache_key] = result
+        if self._disk_cache is not None:
+            self._disk_cache.set(cache_key, result, expire=SERPER_CACHE_TTL)
+    
+    def _post(
+        self,
+        endpoint: str,
+        payload: Union[Dict[str, Any], List[Dict[str, Any]]]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """POST to the Serper API; the session adapter retries transient failures."""
         url = f"{self.base_url}/{endpoint}"
         
         try:
-            response = requests.post(
+            # The session already sends Content-Type: application/json
+            response = self.session.post(
                 url,
-                headers=self.headers,
-                json=payload,
-                timeout=REQUEST_TIMEOUT
+                data=orjson.dumps(payload),
+                timeout=_TIMEOUT
             )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            data = orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             raise Exception(f"Serper API request failed: {str(e)}")
+        
+        if endpoint == "search":
+            # Drop knowledge graph, related searches, etc. before anything is cached
+            if isinstance(data, list):
+                return [_slim_search_response(item) for item in data]
+            if "organic" in data:
+                return _slim_search_response(data)
+        return data
+    
+    def _submit_searches(
+        self,
+        queries: List[str],
+        num: int,
+        force_refresh: bool = False
+    ) -> List[Future]:
+        """Start search requests on the shared pool, one future per query.
+        
+        Uncached queries are sent SERPER_BATCH_SIZE at a time through the bulk
+        /search endpoint. Callers consume the futures in query order so
+        progress reporting and result ordering match a sequential loop.
+        """
+        payloads = [{"q": query, "num": num} for query in queries]
+        if not self._batch_supported:
+            return [
+                _SEARCH_EXECUTOR.submit(self._make_request, "search", payload, force_refresh)
+                for payload in payloads
+            ]
+        
+        futures = []
+        pending = []
+        for payload in payloads:
+            future = Future()
+            futures.append(future)
+            cached = None
+            if ENABLE_CACHE and not force_refresh:
+                cached = self._get_cached(self._cache_key("search", payload))
+            if cached is not None:
+                future.set_running_or_notify_cancel()
+                future.set_result(cached)
+            else:
+                pending.append((payload, future))
+        
+        for start in range(0, len(pending), SERPER_BATCH_SIZE):
+            _SEARCH_EXECUTOR.submit(self._run_search_batch, pending[start:start + SERPER_BATCH_SIZE])
+        return futures
+    
+    def _run_search_batch(self, batch: List[tuple]) -> None:
+        """Run one bulk search and resolve each query's future from it."""
+        batch = [(payload, future) for payload, future in batch
+                 if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        payloads = [payload for payload, _ in batch]
+        
+        try:
+            responses = self._post("search", payloads) if len(payloads) > 1 else None
+            
+            if not isinstance(responses, list) or len(responses) != len(payloads):
+                if responses is not None:
+                    # Bulk requests not honoured; fall back to one POST per query
+                    logger.warning("Serper bulk search unsupported, sending queries individually")
+                    self._batch_supported = False
+                responses = []
+                for payload in payloads:
+                    try:
+                        responses.append(self._post("search", payload))
+                    except Exception as e:
+                        responses.append(e)
+            
+            for (payload, future), response in zip(batch, responses):
+                if isinstance(response, Exception):
+                    future.set_exception(response)
+                    continue
+                if ENABLE_CACHE:
+                    try:
+                        self._store_cached(self._cache_key("search", payload), response)
+                    except Exception as e:
+                        logger.warning("Failed to cache search results: %s", e)
+                future.set_result(response)
+        except Exception as e:
+            # Callers block on these futures, so none may be left pending
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
     
     def search_complaints(
         self,
@@ -71,13 +516,19 @@ class SerperClient:
         progress_callback: Optional[callable] = None,
         target_audience: Optional[str] = None,
         use_ai_queries: bool = True,
-        search_strategy: str = "Diverse Platforms"
+        search_strategy: str = "Diverse Platforms",
+        force_refresh: bool = False
     ) -> Dict[str, Any]:
-        """Search for complaints about a problem across platforms."""
+        """Search for complaints about a problem across platforms.
+        
+        Identical searches from the last SERPER_CACHE_TTL seconds are served
+        from cache unless force_refresh is set.
+        """
         if not platforms:
             platforms = ["reddit", "forums", "reviews"]
         
         all_results = []
+        seen_links = set()
         
         # Generate search queries using Claude if enabled
         if use_ai_queries:
@@ -89,12 +540,9 @@ class SerperClient:
                     target_audience=target_audience,
                     num_queries=60
                 )
-                print(f"DEBUG: Generated {len(search_queries)} AI-optimized search queries")
-            except Exception as e:
-                print(f"ERROR: Failed to generate AI queries: {str(e)}")
-                print(f"Error type: {type(e).__name__}")
-                import traceback
-                traceback.print_exc()
+                logger.debug("Generated %d AI-optimized search queries", len(search_queries))
+            except Exception:
+                logger.exception("Failed to generate AI queries")
                 use_ai_queries = False
         
         if not use_ai_queries:
@@ -114,23 +562,7 @@ class SerperClient:
                     # Extract the core problem area
                     if "marketer" in problem_lower and "creative" in problem_lower:
                         # Simple, broad queries that will get results
-                        search_queries = [
-                            'marketing creatives difficult',
-                            'ad creative frustrating reddit',
-                            'creating marketing visuals problem',
-                            'design marketing materials time',
-                            'marketing design without designer',
-                            'canva adobe marketing complicated',
-                            'marketer need designer',
-                            'marketing creative process slow',
-                            'marketing creative assets help',
-                            'marketing team design bottleneck',
-                            'social media graphics overwhelmed',
-                            'ad creatives running out ideas',
-                            'marketing design tools problems',
-                            'ai design tools marketing',
-                            'creative automation marketing'
-                        ]
+                        search_queries = list(_MARKETER_QUERIES)
                     elif len(problem) > 50:
                         search_term = problem[:30] + "..."
                     else:
@@ -142,45 +574,18 @@ class SerperClient:
             if 'search_queries' not in locals():
                 # Much simpler queries to get more results
                 search_queries = [
-                # Reddit searches - simple
-                f'{search_term} frustrated reddit',
-                f'{search_term} annoying reddit',
-                f'{search_term} problem reddit',
-                f'{search_term} issue reddit',
-                f'{search_term} help reddit',
-                
-                # Forums - simple
-                f'{search_term} problem quora',
-                f'{search_term} frustrating forum',
-                f'{search_term} issue discussion',
-                f'{search_term} difficult forum',
-                
-                # Review and feedback
-                f'{search_term} review negative',
-                f'{search_term} cons downsides',
-                f'{search_term} complaints',
-                f'{search_term} disappointed',
-                
-                # Alternative searches
-                f'{search_term} alternative',
-                f'{search_term} better than',
-                f'switching from {search_term}',
-                
-                # General searches
-                f'{search_term} waste time',
-                f'{search_term} waste money',
-                f'{search_term} biggest problem',
-                f'{search_term} main issue',
-                f'{search_term} worst thing',
-                f'{search_term} doesn\'t work',
-                f'{search_term} not working',
-                f'{search_term} broken',
-                f'{search_term} difficult use'
+                    template.format(t=search_term)
+                    for template in _COMPLAINT_QUERY_TEMPLATES
                 ]
         
+        search_queries = _dedupe_queries(search_queries)
         query_results = []
         
-        for i, query in enumerate(search_queries, 1):
+        # 30 results per query to cast a wide net; no time filter
+        # ("tbs": self._get_time_filter()) so more results come back
+        futures = self._submit_searches(search_queries, num=30, force_refresh=force_refresh)
+        
+        for i, (query, future) in enumerate(zip(search_queries, futures), 1):
             # Update progress if callback provided
             if progress_callback:
                 progress_callback({
@@ -190,13 +595,6 @@ class SerperClient:
                     "status": "searching"
                 })
             
-            payload = {
-                "q": query,
-                "num": 30,  # Get 30 results per query to cast wider net
-                # Remove time filter to get more results
-                # "tbs": self._get_time_filter()
-            }
-            
             query_info = {
                 "query": query,
                 "results_count": 0,
@@ -204,10 +602,10 @@ class SerperClient:
             }
             
             try:
-                results = self._make_request("search", payload)
+                results = future.result()
                 
                 if "organic" in results:
-                    print(f"DEBUG: Query '{query[:50]}...' returned {len(results['organic'])} results")
+                    logger.debug("Query '%.50s...' returned %d results", query, len(results["organic"]))
                     query_info["results_count"] = len(results["organic"])
                     query_info["status"] = "success"
                     
@@ -222,15 +620,21 @@ class SerperClient:
                         })
                     
                     for result in results["organic"]:
+                        # Related queries often return the same thread
+                        link = result.get("link", "")
+                        if link:
+                            if link in seen_links:
+                                continue
+                            seen_links.add(link)
                         all_results.append({
                             "title": result.get("title", ""),
                             "snippet": result.get("snippet", ""),
-                            "link": result.get("link", ""),
+                            "link": link,
                             "date": result.get("date", ""),
-                            "source": self._identify_source(result.get("link", ""))
+                            "source": self._identify_source(link)
                         })
                 else:
-                    print(f"DEBUG: Query '{query[:50]}...' returned no organic results")
+                    logger.debug("Query '%.50s...' returned no organic results", query)
                     query_info["status"] = "no_results"
                     
                     if progress_callback:
@@ -241,11 +645,8 @@ class SerperClient:
                             "status": "no_results"
                         })
                 
-                # Add a small delay between requests
-                time.sleep(0.3)  # Reduced delay for 60 queries
-                
             except Exception as e:
-                print(f"Search query failed: {query}, Error: {str(e)}")
+                logger.warning("Search query failed: %s, Error: %s", query, e)
                 query_info["status"] = "failed"
                 query_info["error"] = str(e)
                 
@@ -275,110 +676,59 @@ class SerperClient:
         pain_points: List[str]
     ) -> List[Dict[str, Any]]:
         """Search for competitors using AI-generated queries from pain points."""
-        print(f"\nDEBUG: Using AI to generate competitor queries from pain points")
+        logger.debug("Using AI to generate competitor queries from pain points")
         
-        # Use Claude to generate search queries
+        # ClaudeClient caches the generated query list
         try:
             from utils.claude_client import ClaudeClient
-            claude = ClaudeClient()
-            
-            prompt = f"""Based on this problem and the pain points discovered, generate search queries to find existing solutions and competitors.
-
-Problem: {problem}
-
-Pain Points:
-{chr(10).join(f'- {point}' for point in pain_points)}
-
-Generate 15 search queries that will help find:
-1. Existing software/tools that solve these pain points
-2. Companies providing solutions to these problems
-3. Alternatives people are using
-
-Think about:
-- What would someone search for when looking for a solution to these pain points?
-- What keywords would existing solutions use in their marketing?
-- What terms would appear on competitor websites?
-
-Return ONLY a JSON array of search query strings. Keep queries simple and focused.
-
-Examples of good queries:
-- "automated invoice processing software"
-- "customer feedback management platform"
-- "marketing automation tools pricing"
-
-Return the queries as a JSON array."""
-            
-            response = claude.generate_response(
-                prompt=prompt,
-                system_prompt="You are an expert at competitive intelligence and market research. Return only valid JSON arrays.",
-                temperature=0.7
-            )
-            
-            # Parse response
-            content = response["content"].strip()
-            if content.startswith('```'):
-                import re
-                content = re.sub(r'^```(?:json)?\s*', '', content)
-                content = re.sub(r'\s*```$', '', content)
-                content = content.strip()
-            
-            search_queries = json.loads(content)
-            print(f"DEBUG: AI generated {len(search_queries)} competitor search queries")
-            
-        except Exception as e:
-            print(f"ERROR: Failed to generate AI queries: {str(e)}")
+            search_queries = ClaudeClient().generate_competitor_queries(problem, pain_points)
+            logger.debug("AI generated %d competitor search queries", len(search_queries))
+        except Exception:
+            logger.exception("Failed to generate AI competitor queries")
             # Fallback to regular search
             return self.search_competitors(problem)
         
         # Execute the AI-generated queries
         competitors = []
+        seen_domains = set()
         
-        for i, query in enumerate(search_queries[:15], 1):  # Limit to 15 queries
-            payload = {
-                "q": query,
-                "num": 20
-            }
-            
+        search_queries = _dedupe_queries(search_queries)[:15]  # Limit to 15 queries
+        futures = self._submit_searches(search_queries, num=20)
+        
+        for i, (query, future) in enumerate(zip(search_queries, futures), 1):
             try:
-                results = self._make_request("search", payload)
+                results = future.result()
                 
                 if "organic" in results:
-                    print(f"\nDEBUG: Query {i}/15: '{query}'")
-                    print(f"  → {len(results['organic'])} results")
+                    logger.debug("Query %d/%d: '%s' -> %d results", i, len(search_queries), query, len(results["organic"]))
                     
                     found_in_query = 0
                     for result in results["organic"]:
-                        if self._is_potential_competitor(result):
+                        # One entry per domain; skip before the filtering work
+                        domain = self._competitor_key(result)
+                        if domain in seen_domains:
+                            continue
+                        text = _result_text(result)
+                        if self._is_potential_competitor(result, text):
+                            seen_domains.add(domain)
                             comp_data = {
                                 "name": self._extract_company_name(result),
                                 "title": result.get("title", ""),
                                 "description": result.get("snippet", ""),
                                 "link": result.get("link", ""),
-                                "pricing_mentioned": self._has_pricing_info(result)
+                                "pricing_mentioned": self._has_pricing_info(text)
                             }
                             competitors.append(comp_data)
                             found_in_query += 1
                     
-                    print(f"  → Found {found_in_query} competitors")
-                
-                time.sleep(0.3)
+                    logger.debug("  -> Found %d competitors", found_in_query)
                 
             except Exception as e:
-                print(f"Search failed for query: {query}, Error: {str(e)}")
+                logger.warning("Search failed for query: %s, Error: %s", query, e)
                 continue
         
-        # Remove duplicates
-        print(f"\nDEBUG: Total competitors before deduplication: {len(competitors)}")
-        seen_domains = set()
-        unique_competitors = []
-        for comp in competitors:
-            domain = self._get_domain(comp["link"]) if comp.get("link") else comp["name"]
-            if domain not in seen_domains:
-                seen_domains.add(domain)
-                unique_competitors.append(comp)
-        
-        print(f"DEBUG: Unique competitors after deduplication: {len(unique_competitors)}")
-        return unique_competitors
+        logger.debug("Unique competitors found: %d", len(competitors))
+        return competitors
     
     def search_competitors(
         self,
@@ -387,9 +737,10 @@ Return the queries as a JSON array."""
     ) -> List[Dict[str, Any]]:
         """Search for competitors and existing solutions."""
         if not solution_keywords:
-            solution_keywords = ["software", "tool", "platform", "service", "app", "solution", "system"]
+            solution_keywords = _DEFAULT_SOLUTION_KEYWORDS
         
         competitors = []
+        seen_domains = set()
         
         # Extract key concepts from problem description
         problem_lower = problem.lower()
@@ -398,20 +749,12 @@ Return the queries as a JSON array."""
         search_base = problem
         
         # Handle "I want to make/build/create X" patterns
-        solution_patterns = [
-            r"i want to (?:make|build|create|develop) (?:a |an )?(.+)",
-            r"(?:web app|app|platform|tool|software|system) for (.+) (?:that|which)",
-            r"solution for (.+)",
-            r"help (?:with |for )?(.+)"
-        ]
-        
-        import re
-        for pattern in solution_patterns:
-            match = re.search(pattern, problem_lower)
+        for pattern in _SOLUTION_PATTERNS:
+            match = pattern.search(problem_lower)
             if match:
                 # Extract the core concept
                 search_base = match.group(1)
-                print(f"DEBUG: Extracted search base from pattern: '{search_base}'")
+                logger.debug("Extracted search base from pattern: '%s'", search_base)
                 break
         
         # Clean up the search base
@@ -422,81 +765,80 @@ Return the queries as a JSON array."""
             # Extract key nouns and adjectives
             words = search_base.split()
             # Keep important words, skip common ones
-            skip_words = ['the', 'a', 'an', 'and', 'or', 'with', 'for', 'to', 'that', 'which', 'gives', 'provides']
-            key_words = [w for w in words if w not in skip_words][:5]
+            key_words = [w for w in words if w not in _SKIP_WORDS][:5]
             search_base = ' '.join(key_words)
         
-        print(f"DEBUG: Using search base: '{search_base}'")
+        logger.debug("Using search base: '%s'", search_base)
         
         # Build broad queries
         broad_queries = [
-            # Direct searches with extracted base
-            f'{search_base} software',
-            f'{search_base} tools',
-            f'{search_base} platform',
-            f'{search_base} app',
-            f'{search_base} solution',
-            f'{search_base} pricing',
-            f'{search_base} companies',
-            f'best {search_base}',
-            f'{search_base} alternatives',
-            f'{search_base} competitors',
-            f'{search_base} providers',
-            f'{search_base} services'
+            template.format(t=search_base) for template in _COMPETITOR_QUERY_TEMPLATES
         ]
         
         # Also try with the original problem if it's different
         if search_base != problem and len(problem) < 100:
-            broad_queries.extend([
-                f'{problem} software',
-                f'{problem} solution',
-                f'{problem} alternatives'
-            ])
+            broad_queries.extend(
+                template.format(t=problem) for template in _PROBLEM_COMPETITOR_QUERY_TEMPLATES
+            )
         
         # Execute broad queries first
-        print(f"DEBUG: Executing {len(broad_queries)} broad competitor queries")
-        for i, query in enumerate(broad_queries, 1):
-            payload = {
-                "q": query,
-                "num": 30  # Increased from 20
-            }
-            
+        broad_queries = _dedupe_queries(broad_queries)
+        dispatched = {query.lower() for query in broad_queries}
+        logger.debug("Executing %d broad competitor queries", len(broad_queries))
+        futures = self._submit_searches(broad_queries, num=30)
+        for i, (query, future) in enumerate(zip(broad_queries, futures), 1):
             try:
-                results = self._make_request("search", payload)
+                results = future.result()
                 
                 if "organic" in results:
-                    print(f"DEBUG: Query {i}/{len(broad_queries)}: '{query[:50]}...' returned {len(results['organic'])} results")
+                    logger.debug(
+                        "Query %d/%d: '%.50s...' returned %d results",
+                        i, len(broad_queries), query, len(results["organic"])
+                    )
                     competitor_count_before = len(competitors)
                     
                     for result in results["organic"]:
+                        # One entry per domain; skip before the filtering work
+                        domain = self._competitor_key(result)
+                        if domain in seen_domains:
+                            continue
                         # More relaxed filtering
-                        is_competitor = self._is_potential_competitor(result)
+                        text = _result_text(result)
+                        is_competitor = self._is_potential_competitor(result, text)
                         if is_competitor:
+                            seen_domains.add(domain)
                             comp_data = {
                                 "name": self._extract_company_name(result),
                                 "title": result.get("title", ""),
                                 "description": result.get("snippet", ""),
                                 "link": result.get("link", ""),
-                                "pricing_mentioned": self._has_pricing_info(result)
+                                "pricing_mentioned": self._has_pricing_info(text)
                             }
                             competitors.append(comp_data)
-                            print(f"  ✓ Added competitor: {comp_data['name'][:50]}...")
+                            logger.debug("  Added competitor: %.50s...", comp_data["name"])
                     
                     new_competitors = len(competitors) - competitor_count_before
-                    print(f"  → Found {new_competitors} competitors from this query")
+                    logger.debug("  -> Found %d competitors from this query", new_competitors)
                 else:
-                    print(f"DEBUG: Query {i}: No organic results")
-                
-                time.sleep(0.3)  # Reduced delay
+                    logger.debug("Query %d: No organic results", i)
                 
             except Exception as e:
-                print(f"Competitor search failed for: {query}, Error: {str(e)}")
+                logger.warning("Competitor search failed for: %s, Error: %s", query, e)
                 continue
+            
+            # Downstream analysis only looks at the first 20
+            if len(competitors) >= 30:
+                for pending in futures[i:]:
+                    pending.cancel()
+                break
         
         # Then do more specific searches if needed
         if len(competitors) < 10:
             for keyword in solution_keywords[:3]:  # Just first 3 keywords
-                query = f'{problem} {keyword} pricing'
+                query = " ".join(f'{problem} {keyword} pricing'.split())
+                if query.lower() in dispatched:
+                    continue
+                dispatched.add(query.lower())
                 
                 payload = {
                     "q": query,
@@ -508,40 +850,36 @@ Return the queries as a JSON array."""
                     
                     if "organic" in results:
                         for result in results["organic"]:
-                            if self._is_potential_competitor(result):
+                            domain = self._competitor_key(result)
+                            if domain in seen_domains:
+                                continue
+                            text = _result_text(result)
+                            if self._is_potential_competitor(result, text):
+                                seen_domains.add(domain)
                                 competitors.append({
                                     "name": self._extract_company_name(result),
                                     "title": result.get("title", ""),
                                     "description": result.get("snippet", ""),
                                     "link": result.get("link", ""),
-                                    "pricing_mentioned": self._has_pricing_info(result)
+                                    "pricing_mentioned": self._has_pricing_info(text)
                                 })
                     
+                    if len(competitors) >= 10:
+                        break
+                    
                     time.sleep(0.3)
                     
                 except Exception as e:
-                    print(f"Competitor search failed for: {keyword}, Error: {str(e)}")
+                    logger.warning("Competitor search failed for: %s, Error: %s", keyword, e)
                     continue
         
-        # Remove duplicates based on domain
-        print(f"\nDEBUG: Total competitors before deduplication: {len(competitors)}")
-        seen_domains = set()
-        unique_competitors = []
-        for comp in competitors:
-            domain = self._get_domain(comp["link"]) if comp.get("link") else comp["name"]
-            if domain not in seen_domains:
-                seen_domains.add(domain)
-                unique_competitors.append(comp)
-            else:
-                print(f"  - Duplicate removed: {comp['name']} ({domain})")
-        
-        print(f"DEBUG: Unique competitors after deduplication: {len(unique_competitors)}")
-        if unique_competitors:
-            print("DEBUG: Sample competitors found:")
-            for i, comp in enumerate(unique_competitors[:5], 1):
-                print(f"  {i}. {comp['name']} - Pricing mentioned: {comp.get('pricing_mentioned', False)}")
+        logger.debug("Unique competitors found: %d", len(competitors))
+        if competitors and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sample competitors found:")
+            for i, comp in enumerate(competitors[:5], 1):
+                logger.debug("  %d. %s - Pricing mentioned: %s", i, comp["name"], comp.get("pricing_mentioned", False))
         
-        return unique_competitors
+        return competitors
     
     def search_reviews(
         self,
@@ -559,14 +897,9 @@ Return the queries as a JSON array."""
         
         reviews = []
         
-        for query in queries:
-            payload = {
-                "q": query,
-                "num": 10
-            }
-            
+        for query, future in zip(queries, self._submit_searches(queries, 10)):
             try:
-                results = self._make_request("search", payload)
+                results = future.result()
                 
                 if "organic" in results:
                     for result in results["organic"]:
@@ -578,10 +911,8 @@ Return the queries as a JSON array."""
                             "source": self._identify_review_platform(result.get("link", ""))
                         })
                 
-                time.sleep(0.5)
-                
             except Exception as e:
-                print(f"Review search failed: {query}, Error: {str(e)}")
+                logger.warning("Review search failed: %s, Error: %s", query, e)
                 continue
         
         return reviews
@@ -606,18 +937,13 @@ Return the queries as a JSON array."""
             "growth_rate": None
         }
         
-        for query in queries:
-            payload = {
-                "q": query,
-                "num": 10
-            }
-            
+        for query, future in zip(queries, self._submit_searches(queries, 10)):
             try:
-                results = self._make_request("search", payload)
+                results = future.result()
                 
                 if "organic" in results:
                     for result in results["organic"]:
-                        if self._has_market_data(result):
+                        if self._has_market_data(_result_text(result)):
                             market_data["estimates"].append({
                                 "title": result.get("title", ""),
                                 "snippet": result.get("snippet", ""),
@@ -628,233 +954,115 @@ Return the queries as a JSON array."""
                                 self._get_domain(result.get("link", ""))
                             )
                 
-                time.sleep(0.5)
-                
             except Exception as e:
-                print(f"Market size search failed: {query}, Error: {str(e)}")
+                logger.warning("Market size search failed: %s, Error: %s", query, e)
                 continue
         
         return market_data
     
-    def _identify_source(self, url: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _identify_source(url: str) -> str:
         """Identify the source platform from URL."""
         url_lower = url.lower()
         
-        # Social platforms
-        if "reddit.com" in url_lower:
-            return "Reddit"
-        elif "quora.com" in url_lower:
-            return "Quora"
-        elif "twitter.com" in url_lower or "x.com" in url_lower:
-            return "Twitter/X"
-        elif "facebook.com" in url_lower:
-            return "Facebook"
-        elif "linkedin.com" in url_lower:
-            return "LinkedIn"
-        
-        # Developer/Tech platforms
-        elif "stackoverflow.com" in url_lower or "stackexchange.com" in url_lower:
-            return "Stack Overflow"
-        elif "github.com" in url_lower:
-            return "GitHub"
-        elif "news.ycombinator.com" in url_lower or "ycombinator.com" in url_lower:
-            return "Hacker News"
-        elif "producthunt.com" in url_lower:
-            return "Product Hunt"
-        elif "indiehackers.com" in url_lower:
-            return "Indie Hackers"
-        
-        # Review platforms
-        elif "trustpilot.com" in url_lower:
-            return "Trustpilot"
-        elif "g2.com" in url_lower:
-            return "G2"
-        elif "capterra.com" in url_lower:
-            return "Capterra"
-        elif "glassdoor.com" in url_lower:
-            return "Glassdoor"
-        elif "yelp.com" in url_lower:
-            return "Yelp"
-        elif "amazon.com" in url_lower and "/review" in url_lower:
-            return "Amazon Reviews"
-        
-        # Content platforms
-        elif "medium.com" in url_lower:
-            return "Medium"
-        elif "youtube.com" in url_lower:
-            return "YouTube"
-        elif "wordpress.com" in url_lower or "blogspot.com" in url_lower:
-            return "Blog"
-        
-        # Generic categorization
-        elif "forum" in url_lower:
-            return "Forum"
-        elif "review" in url_lower:
-            return "Review Site"
-        elif "support" in url_lower:
-            return "Support Forum"
-        elif "community" in url_lower:
-            return "Community"
-        else:
-            return "Web"
+        match = _PLATFORM_SOURCE_RE.search(url_lower)
+        if match:
+            return _PLATFORM_SOURCE_LABELS[match.lastgroup]
+        
+        # Generic categorization, in priority order
+        for marker, label in _GENERIC_SOURCES:
+            if marker in url_lower:
+                return label
+        return "Web"
     
     def _is_competitor_result(self, result: Dict[str, Any]) -> bool:
         """Check if search result is likely a competitor."""
-        exclude_domains = ["wikipedia.org", "reddit.com", "quora.com", "youtube.com"]
-        url = result.get("link", "").lower()
-        title = result.get("title", "").lower()
-        snippet = result.get("snippet", "").lower()
+        url = result.get("link", "")
+        combined_text = _result_text(result)
         
         # Exclude certain domains
-        for domain in exclude_domains:
-            if domain in url:
-                return False
+        if _matches_domain(url, _RESULT_EXCLUDE_DOMAINS):
+            return False
         
         # Look for indicators of a product/service
-        product_indicators = ["pricing", "features", "sign up", "free trial", 
-                            "per month", "subscription", "get started"]
-        
-        for indicator in product_indicators:
-            if indicator in title or indicator in snippet:
-                return True
-        
-        return False
+        return _PRODUCT_INDICATOR_RE.search(combined_text) is not None
     
-    def _is_potential_competitor(self, result: Dict[str, Any]) -> bool:
-        """More relaxed check if search result could be a competitor."""
-        exclude_domains = [
-            "wikipedia.org", "reddit.com", "quora.com", "youtube.com",
-            "facebook.com", "twitter.com", "linkedin.com", "instagram.com",
-            "amazon.com", "ebay.com", "indeed.com", "glassdoor.com"
-        ]
+    def _is_potential_competitor(self, result: Dict[str, Any], text: str) -> bool:
+        """More relaxed check if search result could be a competitor.
         
+        `text` is the result's lowercased title and snippet (_result_text).
+        """
         url = result.get("link", "").lower()
         title = result.get("title", "").lower()
-        snippet = result.get("snippet", "").lower()
-        combined_text = title + " " + snippet
         
         # Debug logging
         domain = self._get_domain(url) if url else "no-url"
         
         # Exclude certain domains
-        for excluded in exclude_domains:
-            if excluded in url:
-                print(f"    × Excluded domain: {domain} (matches {excluded})")
-                return False
-        
-        # Exclude obvious non-competitors  
-        exclude_patterns = [
-            "how to", "what is", "tutorial", "guide",
-            "wikipedia", "definition", "meaning"
-        ]
+        excluded = _matches_domain(url, _COMPETITOR_EXCLUDE_DOMAINS)
+        if excluded:
+            logger.debug("    x Excluded domain: %s (matches %s)", domain, excluded)
+            return False
         
         # Only check title for these patterns, not snippet
-        for pattern in exclude_patterns:
-            if pattern in title:
-                print(f"    × Excluded pattern in title: '{pattern}' - {title[:50]}...")
-                return False
-        
-        # Look for ANY business/product indicators
-        business_indicators = [
-            "software", "platform", "solution", "service", "app",
-            "tool", "system", "product", "company", "inc", "ltd",
-            "corp", ".com", ".io", "pricing", "features", "customers",
-            "clients", "users", "enterprise", "business", "professional",
-            "team", "startup", "saas", "cloud", "online", "digital",
-            "free", "trial", "demo", "sign up", "login", "dashboard",
-            "api", "integration", "automate", "manage"
-        ]
+        excluded_pattern = _NON_COMPETITOR_TITLE_RE.search(title)
+        if excluded_pattern:
+            logger.debug("    x Excluded pattern in title: '%s' - %.50s...", excluded_pattern.group(), title)
+            return False
         
         # Check if it has business indicators
-        found_indicators = []
-        for indicator in business_indicators:
-            if indicator in combined_text:
-                found_indicators.append(indicator)
-        
-        if found_indicators:
-            print(f"    ✓ Business indicators found: {found_indicators[:3]} - {domain}")
+        indicator = _BUSINESS_INDICATOR_RE.search(text)
+        if indicator:
+            logger.debug("    Business indicator found: %s - %s", indicator.group(), domain)
             return True
         
         # If it's a .com/.io/.co domain that's not excluded, likely a product
-        business_tlds = [".com", ".io", ".co", ".app", ".ai", ".dev", ".tech"]
-        for tld in business_tlds:
-            if tld in url and "blog" not in url and "news" not in url:
-                print(f"    ✓ Business TLD: {tld} - {domain}")
+        if "blog" not in url and "news" not in url:
+            tld = _BUSINESS_TLD_RE.search(url)
+            if tld:
+                logger.debug("    Business TLD: %s - %s", tld.group(), domain)
                 return True
         
-        print(f"    × No indicators found: {title[:50]}...")
+        logger.debug("    x No indicators found: %.50s...", title)
         return False
     
+    def _competitor_key(self, result: Dict[str, Any]) -> str:
+        """Deduplication key for a competitor result: its domain, else its name."""
+        link = result.get("link", "")
+        return self._get_domain(link) if link else self._extract_company_name(result)
+    
     def _extract_company_name(self, result: Dict[str, Any]) -> str:
         """Extract company name from search result."""
-        title = result.get("title", "")
-        # Simple extraction - take first part before common separators
-        for separator in [" - ", " | ", " — ", ":"]:
-            if separator in title:
-                return title.split(separator)[0].strip()
-        return title.strip()
+        # Simple extraction - take the part before the first common separator
+        return _TITLE_SEPARATOR_RE.split(result.get("title", ""), maxsplit=1)[0].strip()
     
-    def _has_pricing_info(self, result: Dict[str, Any]) -> bool:
-        """Check if result mentions pricing."""
-        text = (result.get("title", "") + " " + result.get("snippet", "")).lower()
-        pricing_keywords = ["$", "per month", "monthly", "pricing", "cost", 
-                          "subscription", "free trial", "price"]
-        
-        return any(keyword in text for keyword in pricing_keywords)
+    def _has_pricing_info(self, text: str) -> bool:
+        """Check if a result's lowercased title and snippet mention pricing."""
+        return _PRICING_KEYWORD_RE.search(text) is not None
     
-    def _get_domain(self, url: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_domain(url: str) -> str:
         """Extract domain from URL."""
         try:
-            from urllib.parse import urlparse
             return urlparse(url).netloc.replace("www.", "")
-        except:
+        except (AttributeError, TypeError, ValueError):
             return url
     
     def _extract_rating(self, result: Dict[str, Any]) -> Optional[float]:
         """Extract rating from search result if present."""
-        import re
-        text = result.get("snippet", "")
-        
-        # Look for patterns like "4.5/5" or "4.5 out of 5"
-        rating_patterns = [
-            r'(\d+\.?\d*)/5',
-            r'(\d+\.?\d*) out of 5',
-            r'(\d+\.?\d*) stars?'
-        ]
-        
-        for pattern in rating_patterns:
-            match = re.search(pattern, text)
-            if match:
-                try:
-                    return float(match.group(1))
-                except:
-                    pass
-        
-        return None
+        match = _RATING_RE.search(result.get("snippet", ""))
+        return float(match.group(1)) if match else None
     
     def _identify_review_platform(self, url: str) -> str:
         """Identify the review platform from URL."""
-        platforms = {
-            "g2.com": "G2",
-            "capterra.com": "Capterra",
-            "trustpilot.com": "Trustpilot",
-            "getapp.com": "GetApp",
-            "softwareadvice.com": "Software Advice"
-        }
-        
-        for domain, platform in platforms.items():
-            if domain in url:
-                return platform
-        
-        return "Other"
+        match = _REVIEW_PLATFORM_RE.search(url)
+        return _REVIEW_PLATFORMS[match.group()] if match else "Other"
     
-    def _has_market_data(self, result: Dict[str, Any]) -> bool:
-        """Check if result contains market size data."""
-        text = (result.get("title", "") + " " + result.get("snippet", "")).lower()
-        market_keywords = ["billion", "million", "market size", "market worth",
-                         "industry report", "statistics", "growth rate", "cagr"]
-        
-        return any(keyword in text for keyword in market_keywords)
+    def _has_market_data(self, text: str) -> bool:
+        """Check if a result's lowercased title and snippet contain market size data."""
+        return _MARKET_KEYWORD_RE.search(text) is not None
     
     def _generate_reddit_focused_queries(self, problem: str) -> List[str]:
         """Generate Reddit-focused search queries for better coverage."""
@@ -865,56 +1073,27 @@ Return the queries as a JSON array."""
         if "i want to" in problem_lower or "web app for" in problem_lower:
             # Marketing creative example
             if "marketer" in problem_lower and "creative" in problem_lower:
-                base_terms = ["marketing creative", "ad design", "social media graphics", "marketing visuals"]
+                base_terms = _MARKETER_BASE_TERMS
             else:
                 # Use first 30 chars as base
                 base_terms = [problem[:30]]
         else:
             base_terms = [problem]
         
-        queries = []
-        
-        # Simple emotion/problem words to combine
-        simple_keywords = [
-            'frustrated', 'annoying', 'problem', 'issue', 'difficult',
-            'help', 'advice', 'struggle', 'hate', 'sucks', 'terrible',
-            'waste time', 'waste money', 'alternative', 'better',
-            'broken', 'not working', 'complicated', 'expensive',
-            'slow', 'buggy', 'anyone else', 'how to', 'why',
-            'recommendations', 'solution', 'fix', 'workaround'
-        ]
-        
-        # Generate simple queries
-        for term in base_terms:
-            # Add simple Reddit searches
-            for keyword in simple_keywords:
-                queries.append(f'{term} {keyword} reddit')
-            
-            # Add some with site: but keep them simple
-            queries.extend([
-                f'site:reddit.com {term} problem',
-                f'site:reddit.com {term} help',
-                f'site:reddit.com {term} frustrated',
-                f'site:reddit.com {term} alternative',
-                f'site:reddit.com {term} sucks',
-                f'site:reddit.com/r/entrepreneur {term}',
-                f'site:reddit.com/r/marketing {term}',
-                f'site:reddit.com/r/smallbusiness {term}'
-            ])
+        # Per term: simple Reddit searches, then some with site: kept simple.
+        # Built lazily so nothing past the 60-query limit is formatted
+        queries = chain.from_iterable(
+            chain(
+                (f'{term} {keyword} reddit' for keyword in _REDDIT_KEYWORDS),
+                (template.format(t=term) for template in _REDDIT_SITE_QUERY_TEMPLATES)
+            )
+            for term in base_terms
+        )
         
         # Add variations without quotes or complex operators
         if len(base_terms[0]) < 40:
-            queries.extend([
-                f'{base_terms[0]} drives me crazy reddit',
-                f'{base_terms[0]} recommendations reddit',
-                f'{base_terms[0]} better than reddit',
-                f'{base_terms[0]} review reddit',
-                f'{base_terms[0]} opinion reddit',
-                f'{base_terms[0]} experience reddit',
-                f'why {base_terms[0]} difficult reddit',
-                f'anyone use {base_terms[0]} reddit',
-                f'alternative to {base_terms[0]} reddit',
-                f'{base_terms[0]} worth it reddit'
-            ])
-        
-        return queries[:60]  # Limit to 60 queries
\ No newline at end of file
+            queries = chain(queries, (
+                template.format(t=base_terms[0]) for template in _REDDIT_VARIATION_QUERY_TEMPLATES
+            ))
+        
+        return list(islice(queries, 60))  # Limit to 60 queries
\ No newline at end of file
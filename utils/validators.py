@@ -1,12 +1,24 @@
 """Input validation and sanitization utilities."""
+import logging
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
+logger = logging.getLogger(__name__)
+
+# Patterns compiled once at import; validators run for every search result
+_MEANINGFUL_RE = re.compile(r'[a-zA-Z]{3,}')
+# Script blocks with their content, or any other tag
+_SANITIZE_RE = re.compile(r'<script[^>]*>.*?</script>|<[^>]+>', re.IGNORECASE | re.DOTALL)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Path separators and characters not allowed in filenames, all mapped to "_"
+_FILENAME_TABLE = str.maketrans({char: "_" for char in '/\\<>:"|?*'})
+
 
 def validate_problem_description(problem: str) -> tuple[bool, str]:
     """Validate problem description input."""
-    if not problem or not isinstance(problem, str):
+    if not isinstance(problem, str) or not problem:
         return False, "Problem description is required"
     
     problem = problem.strip()
@@ -18,7 +30,7 @@ def validate_problem_description(problem: str) -> tuple[bool, str]:
         return False, "Problem description must be less than 500 characters"
     
     # Check for meaningful content (not just special characters)
-    if not re.search(r'[a-zA-Z]{3,}', problem):
+    if not _MEANINGFUL_RE.search(problem):
         return False, "Problem description must contain meaningful text"
     
     return True, ""
@@ -26,7 +38,7 @@ def validate_problem_description(problem: str) -> tuple[bool, str]:
 
 def validate_target_audience(audience: str) -> tuple[bool, str]:
     """Validate target audience input."""
-    if not audience or not isinstance(audience, str):
+    if not isinstance(audience, str) or not audience:
         return False, "Target audience is required"
     
     audience = audience.strip()
@@ -45,9 +57,10 @@ def sanitize_input(text: str) -> str:
     if not text:
         return ""
     
-    # Remove any potential HTML/script tags and their content
-    text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r'<[^>]+>', '', text)
+    # Remove any potential HTML/script tags and their content; most search
+    # snippets have none, so skip the regex when there is no "<" at all
+    if "<" in text:
+        text = _SANITIZE_RE.sub('', text)
     
     # Remove excessive whitespace
     text = ' '.join(text.split())
@@ -58,16 +71,24 @@ def sanitize_input(text: str) -> str:
 
 def validate_email(email: str) -> bool:
     """Validate email address format."""
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(email_pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_url(url: str) -> bool:
     """Validate URL format."""
+    # Only strings are cached; anything else would be unhashable or invalid
+    if not isinstance(url, str):
+        return False
+    return _validate_url_cached(url)
+
+
+@lru_cache(maxsize=4096)
+def _validate_url_cached(url: str) -> bool:
+    """Parse and check a URL string; memoized for repeated result links."""
     try:
         result = urlparse(url)
         return all([result.scheme, result.netloc])
-    except:
+    except ValueError:
         return False
 
 
@@ -132,18 +153,18 @@ def validate_competitor_data(competitor: Dict[str, Any]) -> bool:
     """Validate competitor data structure."""
     # More lenient validation
     if not isinstance(competitor, dict):
-        print(f"DEBUG: Competitor validation failed - not a dict: {type(competitor)}")
+        logger.debug("Competitor validation failed - not a dict: %s", type(competitor))
         return False
     
     # Just need a name
     if "name" not in competitor or not competitor["name"]:
-        print(f"DEBUG: Competitor validation failed - no name: {competitor}")
+        logger.debug("Competitor validation failed - no name: %s", competitor)
         return False
     
-    # Link is optional but validate if present
-    if "link" in competitor and competitor["link"]:
+    # Link is optional; an invalid one is only worth a debug note
+    if competitor.get("link") and logger.isEnabledFor(logging.DEBUG):
         if not validate_url(competitor["link"]):
-            print(f"DEBUG: Competitor validation warning - invalid URL: {competitor['link']}")
+            logger.debug("Competitor validation warning - invalid URL: %s", competitor["link"])
             # Don't fail, just warn
     
     return True
@@ -179,11 +200,8 @@ def validate_export_format(format: str) -> bool:
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe file operations."""
-    # Remove any path separators
-    filename = filename.replace("/", "_").replace("\\", "_")
-    
-    # Remove special characters
-    filename = re.sub(r'[<>:"|?*]', '_', filename)
+    # Replace path separators and special characters in one pass
+    filename = filename.translate(_FILENAME_TABLE)
     
     # Limit length
     name, ext = filename.rsplit(".", 1) if "." in filename else (filename, "")